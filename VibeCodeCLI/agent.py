@@ -5,6 +5,22 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from llm_utils import LLMUtils
 
+# Prefer orjson for parsing large LLM responses when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _json_loads(text):
+    """Parse JSON with orjson when available, retrying with json for input orjson
+    rejects but json accepts (NaN/Infinity literals, lone surrogates)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 # Load environment variables at module level
 try:
     from dotenv import load_dotenv
@@ -117,15 +133,17 @@ class LLMCodingAgent:
             print(f"LLM raw response (attempt {attempt+1}):", repr(llm_response))
             try:
                 # Clean up response if it has markdown code blocks
-                if llm_response.strip().startswith("```"):
-                    lines = llm_response.strip().splitlines()
+                stripped = llm_response.strip()
+                if stripped.startswith("```"):
+                    lines = stripped.splitlines()
                     llm_response = "\n".join(lines[1:-1])
+                    stripped = llm_response.strip()
                 
                 # Handle single quotes in JSON (common LLM mistake)
-                if llm_response.strip().startswith("{'files'"):
+                if stripped.startswith("{'files'"):
                     llm_response = llm_response.replace("'", '"')
                 
-                data = json.loads(llm_response)
+                data = _json_loads(llm_response)
                 files = data.get("files", [])
                 
                 if not files:
@@ -0,0 +1,335 @@
+"""Headless tests for CodingAgentApp refresh coalescing and caching"""
+import asyncio
+import threading
+
+import pytest
+from textual.widgets import Log, TabbedContent
+
+import textual_agent
+from textual_agent import CodingAgentApp, FallbackMonitoring, file_contents
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    """An app with a dummy API key, run from a scratch directory"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    return CodingAgentApp()
+
+
+def _record_refreshes(app):
+    """Replace both refresh passes with recorders and drain anything queued by on_mount"""
+    calls = []
+    app.update_ui = lambda: calls.append('ui')
+    app.update_monitoring_display = lambda: calls.append('monitoring')
+    app._flush_ui()
+    calls.clear()
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_mark_during_flush_is_not_lost(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        calls = _record_refreshes(app)
+
+        # A refresh pass that triggers another request, as a worker batch can
+        def update_ui():
+            calls.append('ui')
+            app._mark_dirty('monitoring')
+        app.update_ui = update_ui
+
+        app._mark_dirty('ui')
+        app._flush_ui()
+        assert calls == ['ui']
+        app._flush_ui()
+        assert calls == ['ui', 'monitoring']
+
+
+@pytest.mark.asyncio
+async def test_batch_built_before_a_flush_still_refreshes(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        calls = _record_refreshes(app)
+
+        # Worker threads build their batch before the main thread applies it
+        batch = ((app._mark_dirty, 'ui'),)
+        app._flush_ui()
+        app._run_ui_calls(batch)
+        app._flush_ui()
+        assert calls == ['ui']
+
+
+@pytest.mark.asyncio
+async def test_refresh_still_happens_after_a_flush(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        calls = _record_refreshes(app)
+
+        app._mark_dirty('ui')
+        app._mark_dirty('ui')
+        await pilot.pause(0.3)
+        assert calls == ['ui']
+
+        app._mark_dirty('ui')
+        await pilot.pause(0.3)
+        assert calls == ['ui', 'ui']
+
+
+@pytest.mark.asyncio
+async def test_monitoring_callback_burst_renders_once(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        calls = _record_refreshes(app)
+
+        # Monitoring callbacks arrive on the agent's worker thread
+        def burst():
+            for _ in range(50):
+                app.on_monitoring_update({})
+        worker = threading.Thread(target=burst)
+        worker.start()
+        worker.join()
+        await pilot.pause(0.3)
+        assert calls == ['monitoring']
+
+
+@pytest.mark.asyncio
+async def test_change_summary_compares_against_snapshot(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        files = [
+            {'filename': 'main.py', 'content': 'print(1)'},
+            {'filename': 'old.py', 'content': 'x = 1'},
+        ]
+        snapshot = file_contents(files)
+
+        # Later edits to the file dicts must not leak into the snapshot
+        files[0]['content'] = 'print(2)'
+        new_files = [files[0], {'filename': 'new.py', 'content': 'y = 2'}]
+
+        summary = app.generate_change_summary(snapshot, new_files, False)
+        assert "➕ Added: new.py" in summary
+        assert "➖ Removed: old.py" in summary
+        assert "📝 Modified: main.py" in summary
+
+        unchanged = [dict(f) for f in new_files]
+        summary = app.generate_change_summary(file_contents(new_files), unchanged, False)
+        assert "No significant changes detected" in summary
+
+
+def _fake_execution(agent):
+    """Replace write_and_execute_files with a recorder that reports success"""
+    runs = []
+    def write_and_execute_files(files):
+        runs.append(files)
+        return "ok\n", "", True
+    agent.write_and_execute_files = write_and_execute_files
+    return runs
+
+
+@pytest.mark.asyncio
+async def test_exec_cache_hit_and_miss(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        runs = _fake_execution(app.agent)
+        app.agent.project_folder = "demo"
+        files = [
+            {'filename': 'main.py', 'content': 'print(1)'},
+            {'filename': 'util.py', 'content': 'x = 1'},
+        ]
+
+        assert app._write_and_execute_cached(files) == ("ok\n", "", True)
+        assert len(runs) == 1
+
+        # Same contents in a different order: served from the cache
+        same = [dict(f) for f in reversed(files)]
+        app.agent.chat_history = []
+        assert app._write_and_execute_cached(same) == ("ok\n", "", True)
+        assert len(runs) == 1
+        assert app.agent.project_files is same
+        assert app.agent.chat_history == [
+            {"role": "system", "content": "Project files updated. Files: 2"}
+        ]
+
+        changed = [{'filename': 'main.py', 'content': 'print(2)'}, files[1]]
+        app._write_and_execute_cached(changed)
+        assert len(runs) == 2
+
+        # Identical files in another project folder are a different run
+        app.agent.project_folder = "other"
+        app._write_and_execute_cached(files)
+        assert len(runs) == 3
+
+
+@pytest.mark.asyncio
+async def test_exec_cache_keeps_eight_most_recent(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        runs = _fake_execution(app.agent)
+        for n in range(10):
+            app._write_and_execute_cached([{'filename': 'main.py', 'content': f'print({n})'}])
+        assert len(app._exec_cache) == 8
+
+        app._write_and_execute_cached([{'filename': 'main.py', 'content': 'print(9)'}])
+        assert len(runs) == 10
+        app._write_and_execute_cached([{'filename': 'main.py', 'content': 'print(0)'}])
+        assert len(runs) == 11
+
+
+@pytest.mark.asyncio
+async def test_unchanged_feedback_reuses_task_execution(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        runs = _fake_execution(app.agent)
+        app.call_llm_threaded = lambda model, history, max_tokens: ('{"files": []}', None)
+        app.agent.parse_files = lambda response, max_prompt_attempts=3: [
+            {'filename': 'main.py', 'content': 'print(1)'}
+        ]
+        app.agent.estimate_max_tokens = lambda: 100
+
+        await app.process_task("demo")
+        await app._agent_task
+        await pilot.pause()
+        assert len(runs) == 1
+
+        # Feedback that returns the same files skips the rerun
+        app.agent.process_feedback = lambda feedback: [
+            {'filename': 'main.py', 'content': 'print(1)'}
+        ]
+        await app._process_feedback("looks good")
+        await app._agent_task
+        await pilot.pause()
+        assert len(runs) == 1
+        assert app.main_output == "ok\n"
+
+        app.agent.process_feedback = lambda feedback: [
+            {'filename': 'main.py', 'content': 'print(2)'}
+        ]
+        await app._process_feedback("change it")
+        await app._agent_task
+        await pilot.pause()
+        assert len(runs) == 2
+
+
+@pytest.mark.asyncio
+async def test_report_key_is_stable_for_unchanged_session(app, monkeypatch):
+    monkeypatch.setattr(textual_agent, "check_compiler_available", lambda *args, **kwargs: False)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        app.monitor = FallbackMonitoring()
+        app.monitor.log_api_call("gpt-4o", 100, 0.01)
+
+        await app.action_generate_report()
+        assert len(app._report_cache) == 1
+
+        await app.action_generate_report()
+        assert len(app._report_cache) == 1
+        assert app.current_operation == "Report unchanged"
+
+        # New usage changes the live session view and so the key
+        app.monitor.log_api_call("gpt-4o", 50, 0.005)
+        await app.action_generate_report()
+        assert len(app._report_cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancel_reaches_a_running_report_compile(app, monkeypatch):
+    seen = []
+
+    async def slow_compile(tex_path, timeout=30, cancel_event=None):
+        for _ in range(30):
+            if cancel_event.is_set():
+                seen.append('cancelled')
+                return 1
+            await asyncio.sleep(0.1)
+        seen.append('finished')
+        return 0
+
+    monkeypatch.setattr(textual_agent, "check_compiler_available", lambda *args, **kwargs: True)
+    monkeypatch.setattr(textual_agent, "compile_latex_report", slow_compile)
+    # Tall enough that the report button is not hidden behind the footer
+    async with app.run_test(size=(120, 50)) as pilot:
+        await pilot.pause()
+        app.monitor = FallbackMonitoring()
+        app.query_one(TabbedContent).active = "monitoring_tab"
+        await pilot.pause()
+
+        assert await pilot.click("#generate_report_btn")
+        await pilot.pause(0.3)
+        assert app.current_operation == "Compiling LaTeX to PDF..."
+        await pilot.press("ctrl+c")
+        await app.workers.wait_for_complete()
+        assert seen == ['cancelled']
+        assert app.current_operation == "PDF compilation cancelled"
+
+
+@pytest.mark.asyncio
+async def test_tree_returns_after_analysis_on_content_only_update(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        tree = app.query_one("#tree", Log)
+        app.agent.project_files = [{'filename': 'main.py', 'content': 'print(1)'}]
+        app._update_language_detection(app.agent.project_files)
+        await pilot.pause()
+
+        app.action_analyze_project()
+        assert tree.lines[0] == "=== PROJECT ANALYSIS ==="
+
+        # Same filenames, new contents: the tree still replaces the analysis
+        app._update_language_detection([{'filename': 'main.py', 'content': 'print(2)'}])
+        await pilot.pause()
+        assert tree.lines[0] == "📂 PROJECT STRUCTURE"
+
+
+@pytest.mark.asyncio
+async def test_reloading_a_valid_key_replaces_the_setup_instructions(app, monkeypatch):
+    for name in ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "API_KEY", "LLM_API_KEY"):
+        monkeypatch.delenv(name, raising=False)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        tree = app.query_one("#tree", Log)
+        assert not app.api_key_valid
+        instructions = list(tree.lines)
+
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        app.action_reload_key()
+        await pilot.pause()
+        assert app.api_key_valid
+        assert list(tree.lines) != instructions
+        assert tree.lines[0] == "No project loaded yet..."
+
+
+@pytest.mark.asyncio
+async def test_report_lists_model_usage_with_escaped_names(app, monkeypatch):
+    monkeypatch.setattr(textual_agent, "check_compiler_available", lambda *args, **kwargs: False)
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        app.monitor = FallbackMonitoring()
+        app.monitor.log_api_call("gpt_4o & co 100%", 100, 0.01)
+        app.monitor.log_api_call("gpt_4o & co 100%", 50, 0.005)
+
+        await app.action_generate_report()
+        (report,) = app._report_cache.values()
+        with open(report, encoding='utf-8') as f:
+            source = f.read()
+        assert "\\section{Model Usage}" in source
+        assert "\\item gpt\\_4o \\& co 100\\%: 2 calls, \\$0.0150" in source
+
+
+@pytest.mark.asyncio
+async def test_chat_panel_is_trimmed_in_long_sessions(app):
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        chat = app.query_one("#chat", Log)
+        history = [{'role': 'user', 'content': 'task'}]
+        app.agent.chat_history = history
+        app.update_ui()
+
+        for n in range(40):
+            history.append({'role': 'assistant', 'content': f'reply {n}'})
+            app.update_ui()
+            # Header, spacer and two lines per message, never more than twice the recent window
+            assert len(chat.lines) <= 2 + 2 * 2 * textual_agent._CHAT_RECENT
+
+        assert chat.lines[0] == textual_agent._CHAT_HEADER
+        assert chat.lines[-1] == 'reply 39'
@@ -9,55 +9,165 @@ from rich.text import Text
 from rich.console import Console
 
 # Core imports - will be moved to core/ directory
-from agent import LLMCodingAgent
-from llm_utils import LLMUtils
+# The agent, LLM and monitoring modules pull in network and database
+# libraries, so they are imported where first needed to keep startup fast.
 from language import get_handler
-from master_monitoring import MasterMonitoring
-
-# Simple feature import - just one file!
-try:
-    from simple_analyzer import analyze_project_files, format_analysis_for_display
-    SIMPLE_ANALYZER_AVAILABLE = True
-except ImportError:
-    print("Warning: Simple analyzer not available")
-    SIMPLE_ANALYZER_AVAILABLE = False
 
 import os
 import re
 import json
+import logging
 import threading
 import time
 import asyncio
 import subprocess
 import shutil
-import datetime
+import tempfile
+import functools
 from concurrent.futures import ThreadPoolExecutor
-from dotenv import load_dotenv
+import hashlib
 import textwrap
+from types import MappingProxyType
+from collections import OrderedDict, defaultdict
+
+logger = logging.getLogger(__name__)
+
+_global_monitor = None
+_global_monitor_initialized = False
+
+def _get_global_monitor():
+    """Create the global monitoring instance for LLMUtils integration on first use"""
+    global _global_monitor, _global_monitor_initialized
+    if not _global_monitor_initialized:
+        _global_monitor_initialized = True
+        try:
+            from master_monitoring import MasterMonitoring
+            from llm_utils import LLMUtils
+            _global_monitor = MasterMonitoring()
+            LLMUtils._monitor_instance = _global_monitor
+            logger.info("Global monitoring integration established")
+        except Exception as e:
+            logger.warning("Could not establish global monitoring: %s", e)
+            _global_monitor = None
+    return _global_monitor
+
+@functools.lru_cache(maxsize=1)
+def _get_pyperclip():
+    """Import pyperclip for clipboard support once, or return None if unavailable"""
+    try:
+        import pyperclip
+    except ImportError:
+        return None
+    return pyperclip
+
+_SLUG_RE = re.compile(r'[^a-zA-Z0-9]+')
+
+# Dependency scanners for extract_dependencies, applied to whole file contents
+_PY_IMPORT_RE = re.compile(r'^\s*(?:from\s+([a-zA-Z_][\w.]*)\s+import\b|import\s+([a-zA-Z_][\w.]*))', re.M)
+_JS_REQUIRE_RE = re.compile(r"""require\(['"]([^'"]+)['"]""")
+_STDLIB = frozenset({
+    'os', 'sys', 'json', 're', 'datetime', 'time', 'threading',
+    'collections', 'typing', 'pathlib', 'itertools', 'functools',
+})
+
+# Reactive status fields rendered by update_ui
+_UI_FIELDS = frozenset({
+    'current_operation', 'main_output', 'error_output', 'feedback',
+    'detected_language', 'main_file', 'compilation_status',
+})
+
+# Operation status lines shown by the agent workers
+STATUS_CALLING_LLM = "Calling LLM API..."
+STATUS_ATTEMPT_CALLING = "Attempt %d: Calling LLM..."
+STATUS_CANCELLED = "Operation cancelled by user"
+STATUS_LLM_ERROR = "LLM API error occurred"
+STATUS_NO_RESPONSE = "LLM returned no response"
+STATUS_PARSING = "Parsing files..."
+STATUS_PARSE_FAILED = "JSON parsing failed"
+STATUS_NO_FILES = "No files generated"
+STATUS_WRITING = "Writing files and compiling/executing..."
+STATUS_ATTEMPT_DONE = "Project attempt %d completed - awaiting feedback"
+STATUS_COMPLETED = "Project processing completed"
+STATUS_FEEDBACK = "Processing feedback..."
+STATUS_FEEDBACK_DONE = "Feedback processed successfully"
+STATUS_FEEDBACK_FAILED = "Feedback processing failed"
+
+# System message that opens every new project conversation
+_SYSTEM_PROMPT = """You are an expert software engineer. When asked for a project, return a JSON object with a 'files' key. Each file should be an object with 'filename' and 'content'. Example:
+{'files': [{'filename': 'main.py', 'content': '...'}, {'filename': 'utils.js', 'content': '...'}, {'filename': 'App.jsx', 'content': '...'}]}
+Do not include markdown or explanations. Only return the JSON."""
+
+# Prompt file read by action_use_prompter
+_PROMPTER_PATH = os.path.join(os.path.dirname(__file__), 'prompter.txt')
+
+# Box-drawing lines framing the chat history panel
+_CHAT_HEADER = "┌─ 💬 CHAT HISTORY " + "─" * 45 + "┐"
+_CHAT_SPACER = "│" + " " * 63 + "│"
+
+# Messages redrawn in the chat panel; appends may grow it to twice this before a redraw
+_CHAT_RECENT = 8
+
+# Fixed sections of the LaTeX monitoring report
+_LATEX_PREAMBLE = r"""\documentclass{article}
+\usepackage{geometry}
+\usepackage{booktabs}
+\usepackage{amsmath}
+\geometry{margin=1in}
+
+\title{LLM Monitoring Report}
+\author{LLM Coding Agent}
+"""
+
+_LATEX_SUMMARY_HEAD = r"""\begin{document}
+\maketitle
+
+\section{Session Summary}
+This report contains monitoring data for the LLM Coding Agent session.
 
-# Optional import for clipboard support
-try:
-    import pyperclip
-except ImportError:
-    pyperclip = None
-
-# Initialize global monitoring instance for LLMUtils integration
-try:
-    _global_monitor = MasterMonitoring()
-    from llm_utils import LLMUtils
-    LLMUtils._monitor_instance = _global_monitor
-    print("Global monitoring integration established")
-except Exception as e:
-    print(f"Warning: Could not establish global monitoring: {e}")
-    _global_monitor = None
+\begin{table}[h]
+\centering
+\begin{tabular}{lr}
+\toprule
+Metric & Value \\
+\midrule
+"""
+
+_LATEX_SUMMARY_TAIL = r"""\bottomrule
+\end{tabular}
+\caption{API Usage Statistics}
+\end{table}
+
+"""
+
+_LATEX_DETAILS_HEAD = r"""\section{Report Details}
+\begin{itemize}
+"""
+
+_LATEX_DETAILS_TAIL = r"""\item Agent version: LLM Coding Agent v1.0
+\end{itemize}
+
+\end{document}"""
+
+# Single-pass replacements for characters LaTeX treats specially
+_LATEX_ESCAPES = str.maketrans({
+    '\\': r'\textbackslash{}',
+    '&': r'\&', '%': r'\%', '$': r'\$', '#': r'\#', '_': r'\_',
+    '{': r'\{', '}': r'\}',
+    '~': r'\textasciitilde{}', '^': r'\textasciicircum{}',
+})
+
+def escape_latex(text):
+    """Escape text for safe interpolation into LaTeX source"""
+    return str(text).translate(_LATEX_ESCAPES)
 
 def safe_project_name(name):
     # Simple slugify for folder names - enhanced version from main.py
-    name = re.sub(r'[^a-zA-Z0-9]+', '-', name.strip().lower()).strip('-')
-    return name[:32] or 'project'
+    return _SLUG_RE.sub('-', name.strip().lower()).strip('-')[:32] or 'project'
 
 def check_api_key():
     """Check if API key is available in environment variables"""
+    from dotenv import load_dotenv
+    
     # Load .env file from current directory
     load_dotenv()
     
@@ -101,74 +211,184 @@ Note: Never commit your .env file to version control!
 Add .env to your .gitignore file.
 """
 
+# Lookup tables shared by the tree, main-file and language helpers.
+# Built once at import time instead of on every call.
+_FILE_INDICATORS = {
+    '.py': '[PY]',
+    '.js': '[JS]',
+    '.ts': '[TS]',
+    '.html': '[HTML]',
+    '.css': '[CSS]',
+    '.json': '[JSON]',
+    '.md': '[MD]',
+    '.txt': '[TXT]',
+    '.java': '[JAVA]',
+    '.cpp': '[CPP]',
+    '.c': '[C]',
+    '.cs': '[C#]',
+    '.go': '[GO]',
+    '.rs': '[RUST]',
+    '.rb': '[RUBY]',
+    '.php': '[PHP]',
+    '.xml': '[XML]',
+    '.yml': '[YAML]',
+    '.yaml': '[YAML]',
+    '.sh': '[SHELL]',
+    '.bat': '[BAT]',
+    '.sql': '[SQL]'
+}
+
+# Priority order for main files with enhanced detection
+_MAIN_FILE_PRIORITIES = {
+    'main.py': 100,
+    'app.py': 90,
+    'run.py': 85,
+    'server.py': 88,
+    'index.js': 80,
+    'main.js': 80,
+    'app.js': 75,
+    'server.js': 70,
+    'index.ts': 78,
+    'main.ts': 78,
+    'app.ts': 73,
+    'Main.java': 65,
+    'App.java': 60,
+    'main.cpp': 55,
+    'main.c': 50,
+    'Program.cs': 45,
+    'main.cs': 40,
+    'index.html': 35,
+    'main.html': 30,
+    'main.go': 85,
+    'main.rs': 80,
+    'main.rb': 75,
+    'main.php': 70,
+    'manage.py': 85,  # Django
+    'wsgi.py': 82,    # WSGI apps
+    'asgi.py': 82,    # ASGI apps
+}
+
+# Files with executable potential, scored by extension
+_EXECUTABLE_EXTENSIONS = {
+    '.py': 90,
+    '.js': 80,
+    '.ts': 78,
+    '.java': 70,
+    '.cpp': 60,
+    '.c': 50,
+    '.cs': 40,
+    '.go': 85,
+    '.rs': 80,
+    '.rb': 75,
+    '.php': 70,
+    '.html': 20
+}
+
+_LANGUAGE_MAP = {
+    '.py': ('Python', '.py', True, None, 'python'),
+    '.js': ('JavaScript (Node.js)', '.js', True, None, 'node'),
+    '.ts': ('TypeScript', '.ts', True, 'tsc', 'node'),
+    '.java': ('Java', '.java', True, 'javac', 'java'),
+    '.cpp': ('C++', '.cpp', True, 'g++', './'),
+    '.c': ('C', '.c', True, 'gcc', './'),
+    '.cs': ('C#', '.cs', True, 'csc', 'mono'),
+    '.go': ('Go', '.go', True, None, 'go run'),
+    '.rs': ('Rust', '.rs', True, 'rustc', './'),
+    '.rb': ('Ruby', '.rb', True, None, 'ruby'),
+    '.php': ('PHP', '.php', True, None, 'php'),
+    '.html': ('HTML', '.html', False, None, None),
+    '.css': ('CSS', '.css', False, None, None),
+    '.json': ('JSON', '.json', False, None, None),
+    '.md': ('Markdown', '.md', False, None, None),
+    '.txt': ('Text', '.txt', False, None, None),
+    '.xml': ('XML', '.xml', False, None, None),
+    '.yml': ('YAML', '.yml', False, None, None),
+    '.yaml': ('YAML', '.yaml', False, None, None)
+}
+
+# Human-readable language names by extension
+_LANGUAGE_NAMES = {
+    '.py': 'Python',
+    '.js': 'JavaScript',
+    '.ts': 'TypeScript',
+    '.java': 'Java',
+    '.cpp': 'C++',
+    '.c': 'C',
+    '.cs': 'C#',
+    '.go': 'Go',
+    '.rs': 'Rust',
+    '.rb': 'Ruby',
+    '.php': 'PHP',
+    '.html': 'HTML',
+    '.css': 'CSS',
+    '.json': 'JSON',
+    '.md': 'Markdown',
+    '.txt': 'Text',
+    '.xml': 'XML',
+    '.yml': 'YAML',
+    '.yaml': 'YAML',
+    '.sh': 'Shell',
+    '.bat': 'Batch'
+}
+
+@functools.lru_cache(maxsize=1024)
+def _split_name(filename):
+    """Return (basename, lowercased extension) using plain string splits.
+    Memoized so the tree, main-file and language helpers parse each
+    filename only once."""
+    basename = filename.rpartition('/')[2]
+    stem, dot, ext = basename.rpartition('.')
+    if not dot or not stem.strip('.'):
+        # No extension, or a dotfile such as .gitignore
+        return basename, ''
+    return basename, '.' + ext.lower()
+
+# Special file names checked against the lowercased basename, in order
+_SPECIAL_NAMES = (
+    ('readme', '[README]'),
+    ('license', '[LICENSE]'),
+    ('makefile', '[MAKE]'),
+    ('dockerfile', '[DOCKER]'),
+)
+
+@functools.lru_cache(maxsize=512)
+def _file_indicator(filename):
+    """Get the tree indicator for a file from its name or extension"""
+    basename, ext = _split_name(filename)
+    basename_lower = basename.lower()
+    
+    for name, indicator in _SPECIAL_NAMES:
+        if name in basename_lower:
+            return indicator
+    if basename_lower.startswith('.'):
+        return '[CONFIG]'
+    
+    return _FILE_INDICATORS.get(ext, '[FILE]')
+
+def add_tree_paths(tree, filename):
+    """Record the parent -> children edges for each component of filename.
+    Root-level names are stored under the empty-string key."""
+    parent = ""
+    for part in filename.split('/'):
+        tree[parent].add(part)
+        parent = f"{parent}/{part}" if parent else part
+
+def build_tree_index(files):
+    """Build the directory index (parent path -> set of child names) for files"""
+    tree = defaultdict(set)
+    for f in files:
+        add_tree_paths(tree, f['filename'])
+    return tree
+
 def ascii_tree(files):
     """Generate a clean ASCII tree structure from files list"""
-    from collections import defaultdict
-    import os
-    
     if not files:
         return ["No project files yet..."]
     
-    # Build directory structure
-    tree = defaultdict(list)
-    all_paths = set()
-    
-    for f in files:
-        filename = f['filename']
-        parts = filename.split('/')
-        
-        # Add all directory paths
-        for i in range(len(parts)):
-            path = '/'.join(parts[:i+1])
-            all_paths.add(path)
-            
-            if i > 0:
-                parent = '/'.join(parts[:i])
-                tree[parent].append(parts[i])
-    
-    # Get file extension indicators
-    def get_file_indicator(filename):
-        ext = os.path.splitext(filename)[1].lower()
-        indicators = {
-            '.py': '[PY]',
-            '.js': '[JS]', 
-            '.ts': '[TS]',
-            '.html': '[HTML]',
-            '.css': '[CSS]',
-            '.json': '[JSON]',
-            '.md': '[MD]',
-            '.txt': '[TXT]',
-            '.java': '[JAVA]',
-            '.cpp': '[CPP]',
-            '.c': '[C]',
-            '.cs': '[C#]',
-            '.go': '[GO]',
-            '.rs': '[RUST]',
-            '.rb': '[RUBY]',
-            '.php': '[PHP]',
-            '.xml': '[XML]',
-            '.yml': '[YAML]',
-            '.yaml': '[YAML]',
-            '.sh': '[SHELL]',
-            '.bat': '[BAT]',
-            '.sql': '[SQL]'
-        }
-        
-        # Special filename handling
-        name_lower = filename.lower()
-        if 'readme' in name_lower:
-            return '[README]'
-        elif 'license' in name_lower:
-            return '[LICENSE]'
-        elif 'makefile' in name_lower:
-            return '[MAKE]'
-        elif 'dockerfile' in name_lower:
-            return '[DOCKER]'
-        elif name_lower.startswith('.'):
-            return '[CONFIG]'
-        
-        return indicators.get(ext, '[FILE]')
-    
+    return render_tree(build_tree_index(files), len(files))
+
+def render_tree(tree, file_count):
+    """Render a directory index from build_tree_index as ASCII tree lines"""
     def is_directory(path):
         """Check if path is a directory by seeing if it has children"""
         return path in tree and len(tree[path]) > 0
@@ -178,23 +398,23 @@ def ascii_tree(files):
         
         # Skip root level empty path
         if path == "":
-            children = sorted(set(tree.get("", [])))
+            children = sorted(tree.get("", ()))
         else:
             # Get the display name (last part of path)
-            display_name = os.path.basename(path) if path else ""
+            display_name = path.rpartition("/")[2]
             
             # Choose connector
             if depth == 0:
                 connector = ""
-                indicator = "[DIR]" if is_directory(path) else get_file_indicator(path)
+                indicator = "[DIR]" if is_directory(path) else _file_indicator(path)
                 lines.append(f"{prefix}{indicator} {display_name}")
             else:
                 connector = "└── " if is_last else "├── "
-                indicator = "[DIR]" if is_directory(path) else get_file_indicator(path)
+                indicator = "[DIR]" if is_directory(path) else _file_indicator(path)
                 lines.append(f"{prefix}{connector}{indicator} {display_name}")
             
             # Get children for this path
-            children = sorted(set(tree.get(path, [])))
+            children = sorted(tree.get(path, ()))
         
         # Process children
         for i, child in enumerate(children):
@@ -221,13 +441,7 @@ def ascii_tree(files):
     result_lines.append("")  # Empty line for spacing
     
     # Get root level items
-    root_items = []
-    for f in files:
-        first_part = f['filename'].split('/')[0]
-        if first_part not in root_items:
-            root_items.append(first_part)
-    
-    root_items.sort()
+    root_items = sorted(tree.get("", ()))
     
     # Build tree for each root item
     for i, root_item in enumerate(root_items):
@@ -236,7 +450,6 @@ def ascii_tree(files):
         result_lines.extend(lines)
     
     # Add footer with file count and better formatting
-    file_count = len(files)
     result_lines.append("")  # Empty line before footer
     result_lines.append("─" * 30)
     result_lines.append(f"📊 Total files: {file_count}")
@@ -249,69 +462,26 @@ def detect_main_file(files):
     Detect the main executable file from the project files.
     Returns the filename of the main file to execute, or None if no executable file found.
     """
-    # Priority order for main files with enhanced detection
-    main_file_priorities = {
-        'main.py': 100,
-        'app.py': 90,
-        'run.py': 85,
-        'server.py': 88,
-        'index.js': 80,
-        'main.js': 80,
-        'app.js': 75,
-        'server.js': 70,
-        'index.ts': 78,
-        'main.ts': 78,
-        'app.ts': 73,
-        'Main.java': 65,
-        'App.java': 60,
-        'main.cpp': 55,
-        'main.c': 50,
-        'Program.cs': 45,
-        'main.cs': 40,
-        'index.html': 35,
-        'main.html': 30,
-        'main.go': 85,
-        'main.rs': 80,
-        'main.rb': 75,
-        'main.php': 70,
-        'manage.py': 85,  # Django
-        'wsgi.py': 82,    # WSGI apps
-        'asgi.py': 82,    # ASGI apps
-    }
-    
-    # Get all filenames
-    filenames = [f['filename'] for f in files]
-    
-    # First, check for exact matches with priority
-    for filename in filenames:
-        basename = os.path.basename(filename)
-        if basename in main_file_priorities:
-            return filename
-    
-    # If no exact match, look for files by extension with executable potential
-    executable_extensions = {
-        '.py': 90,
-        '.js': 80,
-        '.ts': 78,
-        '.java': 70,
-        '.cpp': 60,
-        '.c': 50,
-        '.cs': 40,
-        '.go': 85,
-        '.rs': 80,
-        '.rb': 75,
-        '.php': 70,
-        '.html': 20
-    }
-    
+    # Only the filenames matter, so repeated calls on the same project hit the cache
+    return _detect_main_file_cached(tuple(f['filename'] for f in files))
+
+@functools.lru_cache(maxsize=32)
+def _detect_main_file_cached(filenames):
+    """Pick the main file from a tuple of filenames; see detect_main_file"""
     best_file = None
     best_score = 0
     
     for filename in filenames:
-        ext = os.path.splitext(filename)[1].lower()
-        if ext in executable_extensions:
-            score = executable_extensions[ext]
-            basename = os.path.basename(filename).lower()
+        basename, ext = _split_name(filename)
+        
+        # An exact main-file name always wins, first match in list order
+        if basename in _MAIN_FILE_PRIORITIES:
+            return filename
+        
+        # Otherwise score files by extension with executable potential
+        if ext in _EXECUTABLE_EXTENSIONS:
+            score = _EXECUTABLE_EXTENSIONS[ext]
+            basename = basename.lower()
             
             # Boost score for files with important keywords in name
             if 'main' in basename:
@@ -337,6 +507,7 @@ def detect_main_file(files):
     
     return best_file
 
+@functools.lru_cache(maxsize=512)
 def get_language_info(filename):
     """
     Get language information based on file extension.
@@ -345,38 +516,22 @@ def get_language_info(filename):
     if not filename:
         return "Unknown", "", False, None, None
     
-    ext = os.path.splitext(filename)[1].lower()
-    basename = os.path.splitext(os.path.basename(filename))[0]
-
-    language_map = {
-        '.py': ('Python', '.py', True, None, 'python'),
-        '.js': ('JavaScript (Node.js)', '.js', True, None, 'node'),
-        '.ts': ('TypeScript', '.ts', True, 'tsc', 'node'),
-        '.java': ('Java', '.java', True, 'javac', 'java'),
-        '.cpp': ('C++', '.cpp', True, 'g++', './'),
-        '.c': ('C', '.c', True, 'gcc', './'),
-        '.cs': ('C#', '.cs', True, 'csc', 'mono'),
-        '.go': ('Go', '.go', True, None, 'go run'),
-        '.rs': ('Rust', '.rs', True, 'rustc', './'),
-        '.rb': ('Ruby', '.rb', True, None, 'ruby'),
-        '.php': ('PHP', '.php', True, None, 'php'),
-        '.html': ('HTML', '.html', False, None, None),
-        '.css': ('CSS', '.css', False, None, None),
-        '.json': ('JSON', '.json', False, None, None),
-        '.md': ('Markdown', '.md', False, None, None),
-        '.txt': ('Text', '.txt', False, None, None),
-        '.xml': ('XML', '.xml', False, None, None),
-        '.yml': ('YAML', '.yml', False, None, None),
-        '.yaml': ('YAML', '.yaml', False, None, None)
-    }
+    _, ext = _split_name(filename)
     
-    return language_map.get(ext, ('Unknown', ext, False, None, None))
+    return _LANGUAGE_MAP.get(ext, ('Unknown', ext, False, None, None))
 
-def check_compiler_available(compile_command):
-    """Check if a compiler/interpreter is available in the system"""
+@functools.lru_cache(maxsize=64)
+def check_compiler_available(compile_command, verify=False):
+    """Check if a compiler/interpreter is available in the system.
+    A PATH lookup is enough by default; pass verify=True to also run the binary."""
     if not compile_command:
         return True
     
+    if shutil.which(compile_command) is None:
+        return False
+    if not verify:
+        return True
+    
     try:
         # Try to run the command with --version or -version flag
         for flag in ['--version', '-version', '--help']:
@@ -392,6 +547,67 @@ def check_compiler_available(compile_command):
     except:
         return False
 
+def content_digest(content):
+    """Return a short BLAKE2b digest of a string, used to key the report cache"""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+
+def file_contents(files):
+    """Map each filename to its content; the strings are shared, not copied"""
+    return {f['filename']: f['content'] for f in files}
+
+def truncate_text(s, n=100):
+    """Cut s to n characters, marking the cut with '...'"""
+    return s if len(s) <= n else s[:n] + '...'
+
+def _approx_tokens(history, response):
+    """Estimate tokens for a call at ~4 characters per token without stringifying the history"""
+    total = sum(len(m.get('content', '')) for m in history)
+    total += len(response) if isinstance(response, str) else len(str(response))
+    return total // 4
+
+async def compile_latex_report(tex_path, timeout=30, cancel_event=None):
+    """
+    Compile a LaTeX report to PDF next to tex_path without blocking the event loop.
+    Auxiliary files go to a private temporary directory so concurrent
+    compiles never share .aux/.log files. pdflatex is terminated if
+    cancel_event gets set while it runs. Returns pdflatex's exit code
+    and raises subprocess.TimeoutExpired after timeout seconds.
+    """
+    tex_path = os.path.abspath(tex_path)
+    with tempfile.TemporaryDirectory(prefix='vccli-latex-') as build_dir:
+        # Single pass: no refs or TOC, so no -draftmode pass is needed
+        cmd = ['pdflatex', '-interaction=batchmode', '-halt-on-error',
+               '-no-shell-escape', f'-output-directory={build_dir}', tex_path]
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        
+        async def watch_cancel():
+            while not cancel_event.is_set():
+                await asyncio.sleep(0.1)
+            proc.terminate()
+        
+        # An event left set by an earlier cancel must not abort this compile
+        watcher = None
+        if cancel_event is not None and not cancel_event.is_set():
+            watcher = asyncio.create_task(watch_cancel())
+        try:
+            await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        finally:
+            if watcher:
+                watcher.cancel()
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        
+        if proc.returncode == 0:
+            pdf_name = os.path.splitext(os.path.basename(tex_path))[0] + '.pdf'
+            shutil.move(os.path.join(build_dir, pdf_name),
+                        os.path.join(os.path.dirname(tex_path), pdf_name))
+    return proc.returncode
+
 def compile_and_run_code(filepath, project_dir):
     """
     Compile and run code using polymorphic language handlers.
@@ -416,221 +632,7 @@ def compile_and_run_code(filepath, project_dir):
         return "", run_output, False
 
 class CodingAgentApp(App):
-    CSS = """
-    .panel {
-        border: solid #00ff00;
-        height: 100%;
-        background: #0d1117;
-    }
-    
-    #left {
-        width: 50%;
-        padding: 1;
-        overflow-y: auto;
-        height: 100%;
-    }
-    
-    #right {
-        width: 50%;
-        padding: 1;
-        overflow-y: auto;
-        height: 100%;
-    }
-    
-    /* Monitoring tab specific styles */
-    .monitoring-panel {
-        padding: 1;
-        background: #0d1117;
-        border: solid #30363d;
-        margin-bottom: 1;
-    }
-    
-    .metric-card {
-        background: #161b22;
-        border: solid #30363d;
-        padding: 1;
-        margin: 1;
-    }
-    
-    .metric-value {
-        color: #00ff00;
-        text-style: bold;
-        text-align: center;
-    }
-    
-    .metric-label {
-        color: #c9d1d9;
-        text-align: center;
-        text-style: italic;
-    }
-    
-    .cost-high {
-        color: #ff4444;
-        text-style: bold;
-    }
-    
-    .cost-medium {
-        color: #ffaa00;
-        text-style: bold;
-    }
-    
-    .cost-low {
-        color: #00ff00;
-        text-style: bold;
-    }
-    
-    DataTable {
-        background: #0d1117;
-        color: #c9d1d9;
-        border: solid #30363d;
-    }
-    
-    TabbedContent {
-        background: #0d1117;
-    }
-    
-    TabPane {
-        background: #0d1117;
-        padding: 1;
-    }
-    
-    .status-good {
-        color: #00ff00;
-        text-style: bold;
-    }
-    
-    .status-error {
-        color: #ff4444;
-        text-style: bold;
-    }
-    
-    .status-warning {
-        color: #ffaa00;
-        text-style: bold;
-    }
-    
-    .status-info {
-        color: #00aaff;
-        text-style: bold;
-    }
-    
-    .label {
-        text-style: bold;
-        color: #c9d1d9;
-    }
-    
-    .section-header {
-        text-style: bold;
-        color: #00ff00;
-        background: #161b22;
-        padding: 0 1;
-        margin-bottom: 1;
-        border: solid #30363d;
-    }
-    
-    Button {
-        margin: 1;
-        min-width: 16;
-        border: solid #30363d;
-    }
-    
-    Button.-primary {
-        background: #238636;
-        color: #ffffff;
-        border: solid #2ea043;
-    }
-    
-    Button.-secondary {
-        background: #1f6feb;
-        color: #ffffff;
-        border: solid #388bfd;
-    }
-    
-    Button.-danger {
-        background: #da3633;
-        color: #ffffff;
-        border: solid #f85149;
-    }
-    
-    Button:hover {
-        text-style: bold;
-    }
-    
-    Input {
-        margin: 1;
-        border: solid #30363d;
-        background: #0d1117;
-        color: #c9d1d9;
-    }
-    
-    Input:focus {
-        border: solid #00aaff;
-        background: #161b22;
-    }
-    
-    Log {
-        border: solid #30363d;
-        height: 1fr;
-        background: #010409;
-        color: #c9d1d9;
-    }
-    
-    #api_status {
-        margin-bottom: 1;
-        padding: 1;
-        border: solid #30363d;
-        background: #161b22;
-    }
-    
-    #operation_status {
-        background: #161b22;
-        padding: 1;
-        border: solid #00aaff;
-        margin: 1 0;
-    }
-    
-    #tree {
-        height: 1fr;
-        min-height: 15;
-        max-height: 100%;
-        background: #010409;
-        border: solid #00ff00;
-        scrollbar-background: #161b22;
-        scrollbar-color: #00ff00;
-        scrollbar-corner-color: #00ff00;
-        scrollbar-size: 1 1;
-        overflow-y: scroll;
-        overflow-x: hidden;
-    }
-    
-    #chat {
-        height: 1fr;
-        min-height: 12;
-        max-height: 100%;
-        background: #010409;
-        border: solid #1f6feb;
-        scrollbar-background: #161b22;
-        scrollbar-color: #1f6feb;
-        scrollbar-corner-color: #1f6feb;
-        scrollbar-size: 1 1;
-        overflow-y: scroll;
-        overflow-x: hidden;
-    }
-    
-    Header {
-        background: #161b22;
-        color: #00ff00;
-    }
-    
-    Footer {
-        background: #161b22;
-        color: #c9d1d9;
-    }
-    
-    Static {
-        color: #c9d1d9;
-    }
-    """
+    CSS_PATH = "coding_agent.tcss"
     
     BINDINGS = [
         ("q", "quit", "Quit"),
@@ -645,6 +647,10 @@ class CodingAgentApp(App):
 
     agent = None  # Will be initialized after key check
     monitor = None  # Monitoring system
+    # Monitor methods resolved once in initialize_monitoring
+    _get_summary = None
+    _get_session = None
+    _get_rtm = None
     attempts = reactive(0)
     max_attempts = reactive(5)
     max_json_retries = reactive(3)
@@ -666,10 +672,32 @@ class CodingAgentApp(App):
     monitoring_data = reactive({})
     monitoring_enabled = reactive(False)
     
-    # Threading components
-    executor = None
-    current_task_future = None
-    cancel_event = None
+    # Async/threading components
+    executor = None  # Bounded pool for agent runs
+    _agent_task = None  # asyncio.Task driving the current agent operation
+    cancel_event = None  # Checked by the worker thread between steps
+    
+    # Project tree index kept between refreshes
+    _tree_state = None
+    _tree_files = frozenset()
+    _last_tree_key = None
+    
+    # Chat history list and length last written to the chat log
+    _last_chat_history = None
+    _last_chat_len = 0
+    _chat_first = 0  # Index of the oldest message in the chat log
+    _chat_placeholder_shown = False
+    
+    # Attempts counter text last written
+    _attempts_text = None
+    
+    # Name/size hash of the files last pushed to the UI by a worker
+    _last_files_hash = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Widgets looked up once in on_mount, keyed by widget id
+        self._widgets = {}
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -753,7 +781,7 @@ class CodingAgentApp(App):
 
     def update_status_display(self, widget_id, label, value, status_type="info"):
         """Update status displays with proper styling"""
-        widget = self.query_one(f"#{widget_id}", Static)
+        widget = self._widgets.get(widget_id) or self.query_one(f"#{widget_id}", Static)
         
         # Remove previous status classes
         widget.remove_class("status-good", "status-error", "status-warning", "status-info")
@@ -774,22 +802,24 @@ class CodingAgentApp(App):
         """Update project control states based on current project status"""
         if not self.api_key_valid:
             # Disable all project controls if no API key
-            self.query_one("#project_input", Input).disabled = True
-            self.query_one("#create_btn", Button).disabled = True
+            self._widgets["project_input"].disabled = True
+            self._widgets["create_btn"].disabled = True
             return
             
         if self.project_active:
             # Project is active - disable new project creation
-            self.query_one("#project_input", Input).disabled = True
-            self.query_one("#create_btn", Button).disabled = True
+            self._widgets["project_input"].disabled = True
+            self._widgets["create_btn"].disabled = True
         else:
             # No active project - enable new project creation
-            self.query_one("#project_input", Input).disabled = False
-            self.query_one("#create_btn", Button).disabled = False
+            self._widgets["project_input"].disabled = False
+            self._widgets["create_btn"].disabled = False
 
     def check_and_initialize_api(self):
         """Check for API key and initialize agent if available"""
         if check_api_key():
+            from agent import LLMCodingAgent
+            
             self.api_key_valid = True
             # Initialize with default values - wrap in try/catch
             self.max_attempts = 5
@@ -803,27 +833,28 @@ class CodingAgentApp(App):
                 self.api_key_valid = False
                 self.agent = None
                 self.update_status_display("api_status", "API Status", f"Error: {str(e)}", "error")
-                self.query_one("#project_input", Input).disabled = True
-                self.query_one("#create_btn", Button).disabled = True
+                self._widgets["project_input"].disabled = True
+                self._widgets["create_btn"].disabled = True
                 return
         else:
             self.api_key_valid = False
             self.agent = None
             self.update_status_display("api_status", "API Status", "Missing", "error")
-            self.query_one("#project_input", Input).disabled = True
-            self.query_one("#create_btn", Button).disabled = True
+            self._widgets["project_input"].disabled = True
+            self._widgets["create_btn"].disabled = True
             
             # Show instructions in the tree area
             instructions = get_env_file_instructions()
-            tree_log = self.query_one("#tree", Log)
+            tree_log = self._widgets["tree"]
             tree_log.clear()
             
-            for line in instructions.split('\n'):
-                if line.strip():
-                    tree_log.write(line)
+            tree_log.write_lines([line for line in instructions.split('\n') if line.strip()])
+            # The tree no longer shows the project, so the next files update must redraw it
+            self._last_tree_key = None
 
     def initialize_monitoring(self):
         """Initialize the monitoring system with enhanced integration"""
+        _get_global_monitor()
         try:
             # Use the enhanced monitoring integration
             success = MonitoringIntegration.setup_monitoring_for_app(self)
@@ -832,15 +863,15 @@ class CodingAgentApp(App):
                 self.monitoring_enabled = True
                 
                 # Force an initial update of the monitoring display
-                self.update_monitoring_display()
+                self._mark_dirty('monitoring')
                 
-                print("Enhanced monitoring system initialized successfully")
+                logger.info("Enhanced monitoring system initialized successfully")
                 
                 # Notify user
                 if hasattr(self, 'notify'):
                     self.notify("Enhanced monitoring system initialized", severity="information")
             else:
-                print("Failed to initialize enhanced monitoring")
+                logger.warning("Failed to initialize enhanced monitoring")
                 self.monitor = None
                 self.monitoring_enabled = False
                 
@@ -848,13 +879,18 @@ class CodingAgentApp(App):
                     self.notify("Warning: Monitoring system failed to initialize", severity="warning")
                 
         except Exception as e:
-            print(f"Error initializing enhanced monitoring: {e}")
+            logger.exception("Error initializing enhanced monitoring")
             self.monitor = None
             self.monitoring_enabled = False
             
             # Notify user of error
             if hasattr(self, 'notify'):
                 self.notify(f"Error initializing monitoring: {str(e)}", severity="error")
+        
+        # The monitor's class is fixed once attached, so probe its API once
+        self._get_summary = getattr(self.monitor, 'get_ui_summary', None)
+        self._get_session = getattr(self.monitor, 'get_session_summary', None)
+        self._get_rtm = getattr(self.monitor, 'get_real_time_metrics', None)
 
     def test_monitoring_integration(self):
         """Test the monitoring system integration"""
@@ -868,8 +904,8 @@ class CodingAgentApp(App):
                 return metrics is not None
             
             return True
-        except Exception as e:
-            print(f"Error testing monitoring integration: {e}")
+        except Exception:
+            logger.exception("Error testing monitoring integration")
             return False
 
     def setup_monitoring_with_callback(self):
@@ -877,15 +913,13 @@ class CodingAgentApp(App):
         try:
             if self.monitor:
                 self.monitor.set_callback(self.on_monitoring_update)
-        except Exception as e:
-            print(f"Error setting up monitoring callback: {e}")
+        except Exception:
+            logger.exception("Error setting up monitoring callback")
 
     def on_monitoring_update(self, monitoring_summary):
         """Callback method for real-time monitoring updates"""
-        try:
-            self.call_from_thread(self._update_monitoring_from_callback, monitoring_summary)
-        except Exception as e:
-            print(f"Error in monitoring update callback: {e}")
+        # Bursts of callbacks collapse into one refresh on the next _flush_ui tick
+        self._mark_dirty('monitoring')
 
     def _update_monitoring_from_callback(self, summary):
         """Thread-safe monitoring update method with better error handling"""
@@ -894,51 +928,57 @@ class CodingAgentApp(App):
             session = summary.get('session', {})
             if session:
                 try:
-                    self.query_one("#total_calls_metric", Static).update(f"{session.get('total_calls', 0):,}")
-                    self.query_one("#total_tokens_metric", Static).update(f"{session.get('total_tokens', 0):,}")
-                    self.query_one("#total_cost_metric", Static).update(f"${session.get('total_cost', 0):.4f}")
-                    self.query_one("#session_cost_metric", Static).update(f"${session.get('session_cost', 0):.4f}")
-                except Exception as e:
-                    print(f"Error updating session metrics: {e}")
+                    metrics = {
+                        "total_calls_metric": f"{session.get('total_calls', 0):,}",
+                        "total_tokens_metric": f"{session.get('total_tokens', 0):,}",
+                        "total_cost_metric": f"${session.get('total_cost', 0):.4f}",
+                        "session_cost_metric": f"${session.get('session_cost', 0):.4f}",
+                    }
+                    for widget_id, value in metrics.items():
+                        if self._last_metrics.get(widget_id) != value:
+                            self._widgets[widget_id].update(value)
+                            self._last_metrics[widget_id] = value
+                except Exception:
+                    logger.exception("Error updating session metrics")
             
             # Update monitoring log (simplified - no tables)
             try:
-                log = self.query_one("#monitoring_log", Log)
+                log = self._widgets["monitoring_log"]
                 log.clear()
                 if hasattr(self.monitor, 'format_ui_summary'):
-                    summary_lines = self.monitor.format_ui_summary()
-                    for line in summary_lines:
-                        log.write(line)
+                    log.write_lines(self.monitor.format_ui_summary())
                 else:
                     # Fallback summary
-                    log.write(f"Total API Calls: {session.get('total_calls', 0)}")
-                    log.write(f"Total Tokens: {session.get('total_tokens', 0):,}")
-                    log.write(f"Total Cost: ${session.get('total_cost', 0):.4f}")
-                    log.write("Monitoring system active")
-            except Exception as e:
-                print(f"Error updating monitoring log: {e}")
+                    log.write_lines([
+                        f"Total API Calls: {session.get('total_calls', 0)}",
+                        f"Total Tokens: {session.get('total_tokens', 0):,}",
+                        f"Total Cost: ${session.get('total_cost', 0):.4f}",
+                        "Monitoring system active",
+                    ])
+            except Exception:
+                logger.exception("Error updating monitoring log")
                 
-        except Exception as e:
-            print(f"Error updating monitoring from callback: {e}")
+        except Exception:
+            logger.exception("Error updating monitoring from callback")
 
     def update_monitoring_display(self):
         """Update the monitoring display with current data"""
         if not self.monitor:
-            print("No monitor available for update")
+            logger.debug("No monitor available for update")
             return
         try:
             # Try different methods based on what's available
-            if hasattr(self.monitor, 'get_ui_summary'):
-                summary = self.monitor.get_ui_summary()
-            elif hasattr(self.monitor, 'get_session_summary'):
+            if self._get_summary:
+                summary = self._get_summary()
+            elif self._get_session:
                 # For MasterMonitoring, use get_session_summary and format it
-                session_data = self.monitor.get_session_summary()
+                session_data = self._get_session()
                 recent_calls = []
                 model_usage = {}
                 
                 # Try to get additional data if available
-                if hasattr(self.monitor, 'get_real_time_metrics'):
-                    metrics = self.monitor.get_real_time_metrics()
+                if self._get_rtm:
+                    metrics = self._get_rtm()
                     recent_calls = metrics.get('recent_calls', [])
                     model_usage = metrics.get('model_usage', {})
                 
@@ -956,16 +996,18 @@ class CodingAgentApp(App):
                 }
                 
             self._update_monitoring_from_callback(summary)
-            print("Monitoring display updated successfully")
+            logger.debug("Monitoring display updated successfully")
         except Exception as e:
-            print(f"Error updating monitoring display: {e}")
+            logger.exception("Error updating monitoring display")
             # Try to show some basic info even if monitoring fails
             try:
-                log = self.query_one("#monitoring_log", Log)
+                log = self._widgets["monitoring_log"]
                 log.clear()
-                log.write("Monitoring system encountered an error")
-                log.write(f"Error: {str(e)}")
-                log.write("Please check console for details")
+                log.write_lines([
+                    "Monitoring system encountered an error",
+                    f"Error: {str(e)}",
+                    "Please check console for details",
+                ])
             except:
                 pass
 
@@ -986,18 +1028,19 @@ class CodingAgentApp(App):
         try:
             self.operation_in_progress = True
             self.current_operation = "Starting project..."
-            self.update_ui()
-            # Submit task processing to thread pool
-            self.current_task_future = self.executor.submit(self.process_task_threaded, task)
+            self._mark_dirty('ui')
+            # Run task processing as a background asyncio task
+            self._cancel_agent_task()
+            self._agent_task = asyncio.create_task(self._run_agent_async(self.process_task_threaded, task))
         except Exception as e:
             self.operation_in_progress = False
             self.error_output = f"Failed to start project: {str(e)}"
             self.current_operation = "Project failed to start"
-            self.update_ui()
+            self._mark_dirty('ui')
             self.notify(f"Error starting project: {str(e)}", severity="error")
         finally:
             # Always refresh monitoring after a prompt
-            self.update_monitoring_display()
+            self._mark_dirty('monitoring')
 
     async def _process_feedback(self, feedback):
         """Process feedback with error handling"""
@@ -1011,21 +1054,38 @@ class CodingAgentApp(App):
 
         self.operation_in_progress = True
         try:
-            self.current_operation = "Processing feedback..."
-            self.update_ui()
-            # Submit feedback processing to thread pool
-            self.current_task_future = self.executor.submit(self.process_feedback_threaded, feedback)
+            self.current_operation = STATUS_FEEDBACK
+            self._mark_dirty('ui')
+            # Run feedback processing as a background asyncio task
+            self._cancel_agent_task()
+            self._agent_task = asyncio.create_task(self._run_agent_async(self.process_feedback_threaded, feedback))
         except Exception as e:
             self.operation_in_progress = False
             self.error_output = f"Failed to process feedback: {str(e)}"
-            self.current_operation = "Feedback processing failed"
-            self.update_ui()
+            self.current_operation = STATUS_FEEDBACK_FAILED
+            self._mark_dirty('ui')
             self.notify(f"Error processing feedback: {str(e)}", severity="error")
         finally:
             # Always refresh monitoring after feedback
-            self.update_monitoring_display()
+            self._mark_dirty('monitoring')
             self.operation_in_progress = False
 
+    def _cancel_agent_task(self):
+        """Cancel the previous agent task if it is still pending or running"""
+        task = self._agent_task
+        if task and not task.done():
+            task.cancel()
+
+    async def _run_agent_async(self, func, *args):
+        """Run a blocking agent workflow without blocking the event loop"""
+        try:
+            await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        except asyncio.CancelledError:
+            # The worker thread sees cancel_event and winds down on its own
+            pass
+        except Exception:
+            logger.exception("Agent task error")
+
     async def on_button_pressed(self, event):
         """Handle button press events with better error handling"""
         try:
@@ -1040,7 +1100,7 @@ class CodingAgentApp(App):
             if event.button.id == "complete_btn":
                 # Cancel any ongoing operation
                 if self.operation_in_progress:
-                    self.action_cancel_operation()
+                    await self.action_cancel_operation()
                 
                 # Mark project as complete and reset state
                 self.project_active = False
@@ -1048,16 +1108,16 @@ class CodingAgentApp(App):
                 self.operation_in_progress = False
                 
                 # Hide feedback controls
-                self.query_one("#feedback_input", Input).display = False
-                self.query_one("#feedback_btn", Button).display = False
-                self.query_one("#complete_btn", Button).display = False
+                self._widgets["feedback_input"].display = False
+                self._widgets["feedback_btn"].display = False
+                self._widgets["complete_btn"].display = False
                 
                 # Clear the project input for next project
-                self.query_one("#project_input", Input).value = ""
+                self._widgets["project_input"].value = ""
                 
                 # Update controls to allow new project creation
                 self.update_project_controls()
-                self.update_ui()
+                self._mark_dirty('ui')
                 
                 self.notify("Project marked as complete! You can now start a new project.", severity="information")
                 return
@@ -1067,16 +1127,16 @@ class CodingAgentApp(App):
                     self.notify("Please complete the current project first!", severity="warning")
                     return
                     
-                task = self.query_one("#project_input", Input).value.strip()
+                task = self._widgets["project_input"].value.strip()
                 if not task:
                     self.notify("Please enter a project description!", severity="warning")
                     return
                     
-                print(f"DEBUG: About to process task: '{task}'")  # Debug output
+                logger.debug("About to process task: '%s'", task)
                 await self.process_task(task)
                 
             elif event.button.id == "feedback_btn":
-                feedback = self.query_one("#feedback_input", Input).value.strip()
+                feedback = self._widgets["feedback_input"].value.strip()
                 if not feedback:
                     self.notify("Please enter feedback!", severity="warning")
                     return
@@ -1096,7 +1156,8 @@ class CodingAgentApp(App):
                 self.action_refresh_monitoring()
                 
             elif event.button.id == "generate_report_btn":
-                await self.action_generate_report()
+                # Run in a worker so key presses such as ctrl+c are handled during the compile
+                self.run_worker(self.action_generate_report(), group="report", exclusive=True)
                 
             elif event.button.id == "reset_stats_btn":
                 await self.action_reset_stats()
@@ -1107,7 +1168,7 @@ class CodingAgentApp(App):
                 
         except Exception as e:
             self.notify(f"Button handler error: {str(e)}", severity="error")
-            print(f"DEBUG: Button handler exception: {e}")  # Debug output
+            logger.exception("Button handler exception")
 
     async def on_input_submitted(self, event):
         """Handle input submission (Enter key) with error handling"""
@@ -1120,7 +1181,7 @@ class CodingAgentApp(App):
                 if not task:
                     self.notify("Please enter a project description!", severity="warning")
                     return
-                print(f"DEBUG: Input submitted task: '{task}'")  # Debug output
+                logger.debug("Input submitted task: '%s'", task)
                 await self.process_task(task)
             elif event.input.id == "feedback_input":
                 feedback = event.input.value.strip()
@@ -1130,12 +1191,33 @@ class CodingAgentApp(App):
                 await self._process_feedback(feedback)
         except Exception as e:
             self.notify(f"Input handler error: {str(e)}", severity="error")
-            print(f"DEBUG: Input handler exception: {e}")  # Debug output
+            logger.exception("Input handler exception")
 
     def on_mount(self):
-        # Initialize thread pool
-        self.executor = ThreadPoolExecutor(max_workers=2)
+        self._cache_widgets()
+        
+        # Truncated display strings, reused while their source is unchanged
+        self._trunc_cache = {}
+        
+        # Status fields changed since the last update_ui; paint all of them once
+        self._dirty_fields = set(_UI_FIELDS)
+        
+        # Metric card text last written, keyed by widget id
+        self._last_metrics = {}
+        
+        # Last few generated reports, keyed by a digest of their session data
+        self._report_cache = OrderedDict()
+        
+        # Recent execution results, keyed by a digest of project folder and files
+        self._exec_cache = OrderedDict()
+        
+        # Coalesce UI refresh requests into at most one pass per 100 ms
+        self._ui_dirty = set()
+        self.set_interval(0.1, self._flush_ui)
+        
+        # Cancellation flag shared with the agent worker thread
         self.cancel_event = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='vccli')
         
         # Initialize monitoring system
         self.initialize_monitoring()
@@ -1143,131 +1225,261 @@ class CodingAgentApp(App):
         # Test monitoring integration
         if self.monitoring_enabled:
             test_result = self.test_monitoring_integration()
-            print(f"Monitoring integration test result: {test_result}")
+            logger.debug("Monitoring integration test result: %s", test_result)
         
         # Initialize data tables for monitoring
         self._setup_monitoring_tables()
         
         self.check_and_initialize_api()
+        if self.api_key_valid:
+            # Show the empty-project placeholder in the tree
+            self._refresh_tree()
         self.main_output = ""
         self.error_output = ""
         self.project_active = False  # Initialize project state
-        self.update_ui()
-        self.update_monitoring_display()
-        self.query_one("#feedback_input", Input).display = False
-        self.query_one("#feedback_btn", Button).display = False
-        self.query_one("#complete_btn", Button).display = False
+        self._mark_dirty('ui')
+        self._mark_dirty('monitoring')
+        self._widgets["feedback_input"].display = False
+        self._widgets["feedback_btn"].display = False
+        self._widgets["complete_btn"].display = False
         self.query_one("#copy_output_btn", Button).display = True
         self.query_one("#copy_all_btn", Button).display = True
 
+    def _mark_dirty(self, what):
+        """Request a 'ui' or 'monitoring' refresh on the next _flush_ui tick.
+        Safe from worker threads: set.add is atomic and _flush_ui only pops."""
+        self._ui_dirty.add(what)
+
+    def _flush_ui(self):
+        """Run each UI refresh requested since the last tick exactly once"""
+        dirty = set()
+        # Pop rather than swap the set so a mark added mid-flush is never dropped
+        while self._ui_dirty:
+            dirty.add(self._ui_dirty.pop())
+        if 'ui' in dirty:
+            self.update_ui()
+        if 'monitoring' in dirty:
+            self.update_monitoring_display()
+
+    def _cache_widgets(self):
+        """Look up frequently updated widgets once so refreshes skip DOM queries"""
+        widget_ids_by_type = (
+            (Static, (
+                "api_status", "operation_status", "output", "error",
+                "feedback_display", "language_status", "main_file_status",
+                "compilation_status", "attempts",
+                "total_calls_metric", "total_tokens_metric",
+                "total_cost_metric", "session_cost_metric",
+            )),
+            (Log, ("tree", "chat", "monitoring_log")),
+            (Input, ("project_input", "feedback_input")),
+            (Button, ("create_btn", "feedback_btn", "complete_btn")),
+        )
+        self._widgets = {
+            widget_id: self.query_one(f"#{widget_id}", widget_type)
+            for widget_type, widget_ids in widget_ids_by_type
+            for widget_id in widget_ids
+        }
+
+    def _trunc(self, s, n, tag):
+        """Return s cut to n characters, reusing the last result for the same string"""
+        cached = self._trunc_cache.get(tag)
+        if cached is not None and cached[0] is s:
+            return cached[1]
+        out = truncate_text(s, n)
+        self._trunc_cache[tag] = (s, out)
+        return out
+
     def update_ui(self):
         """Update all UI elements with current state"""
         try:
+            # Only repaint the status fields whose reactive value changed
+            dirty, self._dirty_fields = self._dirty_fields, set()
+            
             # Update operation status
-            if hasattr(self, 'current_operation') and self.current_operation:
-                self.query_one("#operation_status", Static).update(f"Status: {self.current_operation}")
+            if 'current_operation' in dirty and self.current_operation:
+                self._widgets["operation_status"].update(f"Status: {self.current_operation}")
             
             # Update output and error displays
-            if hasattr(self, 'main_output') and self.main_output:
-                self.query_one("#output", Static).update(f"Output: {self.main_output[:100]}{'...' if len(self.main_output) > 100 else ''}")
-            else:
-                self.query_one("#output", Static).update("")
+            if 'main_output' in dirty:
+                if self.main_output:
+                    self._widgets["output"].update(f"Output: {self._trunc(self.main_output, 100, 'main')}")
+                else:
+                    self._widgets["output"].update("")
             
-            if hasattr(self, 'error_output') and self.error_output:
-                self.query_one("#error", Static).update(f"Error: {self.error_output[:100]}{'...' if len(self.error_output) > 100 else ''}")
-            else:
-                self.query_one("#error", Static).update("")
+            if 'error_output' in dirty:
+                if self.error_output:
+                    self._widgets["error"].update(f"Error: {self._trunc(self.error_output, 100, 'error')}")
+                else:
+                    self._widgets["error"].update("")
             
             # Update feedback display
-            if hasattr(self, 'feedback') and self.feedback:
-                self.query_one("#feedback_display", Static).update(f"Feedback: {self.feedback[:150]}{'...' if len(self.feedback) > 150 else ''}")
-            else:
-                self.query_one("#feedback_display", Static).update("")
+            if 'feedback' in dirty:
+                if self.feedback:
+                    self._widgets["feedback_display"].update(f"Feedback: {self._trunc(self.feedback, 150, 'feedback')}")
+                else:
+                    self._widgets["feedback_display"].update("")
             
             # Update project information
-            if hasattr(self, 'detected_language'):
-                self.query_one("#language_status", Static).update(f"Detected Language: {self.detected_language}")
+            if 'detected_language' in dirty:
+                self._widgets["language_status"].update(f"Detected Language: {self.detected_language}")
             
-            if hasattr(self, 'main_file'):
-                self.query_one("#main_file_status", Static).update(f"Main File: {self.main_file}")
+            if 'main_file' in dirty:
+                self._widgets["main_file_status"].update(f"Main File: {self.main_file}")
             
-            if hasattr(self, 'compilation_status'):
-                self.query_one("#compilation_status", Static).update(f"Compilation: {self.compilation_status}")
+            if 'compilation_status' in dirty:
+                self._widgets["compilation_status"].update(f"Compilation: {self.compilation_status}")
             
-            # Update attempts counter
-            if hasattr(self, 'agent') and self.agent:
+            # Update attempts counter (the agent's counter is not reactive)
+            if self.agent:
                 attempts = getattr(self.agent, 'attempts', 0)
                 max_attempts = getattr(self.agent, 'max_attempts', 5)
-                self.query_one("#attempts", Static).update(f"Attempts: {attempts}/{max_attempts}")
-            
-            # Update project structure tree
-            if hasattr(self, 'agent') and self.agent and getattr(self.agent, 'project_files', None):
-                print(f"DEBUG: Updating project structure with {len(self.agent.project_files)} files")
-                tree_log = self.query_one("#tree", Log)
-                tree_log.clear()
-                
-                # Use the new wrapped formatting
-                wrapped_tree_lines = format_project_structure_wrapped(self.agent.project_files, width=70)
-                print(f"DEBUG: Generated {len(wrapped_tree_lines)} tree lines")
-                for line in wrapped_tree_lines:
-                    tree_log.write(line)
-            else:
-                print("DEBUG: No project files to display")
-                # Show placeholder when no project is loaded
-                try:
-                    tree_log = self.query_one("#tree", Log)
-                    tree_log.clear()
-                    tree_log.write("No project loaded yet...")
-                    tree_log.write("Create a project to see its structure here")
-                except Exception as e:
-                    print(f"DEBUG: Error updating empty tree: {e}")
+                attempts_text = f"Attempts: {attempts}/{max_attempts}"
+                if attempts_text != self._attempts_text:
+                    self._widgets["attempts"].update(attempts_text)
+                    self._attempts_text = attempts_text
             
             # Update chat history with proper vertical formatting and wrapping
-            if hasattr(self, 'agent') and self.agent and getattr(self.agent, 'chat_history', None):
-                print(f"DEBUG: Updating chat history with {len(self.agent.chat_history)} messages")
-                chat_log = self.query_one("#chat", Log)
-                chat_log.clear()
-                
-                # Add header with box
-                chat_log.write("┌─ 💬 CHAT HISTORY " + "─" * 45 + "┐")
-                chat_log.write("│" + " " * 63 + "│")
-                
-                # Show last few messages with proper wrapping
-                recent_messages = self.agent.chat_history[-8:] if len(self.agent.chat_history) > 8 else self.agent.chat_history
+            history = getattr(self.agent, 'chat_history', None) if self.agent else None
+            if history:
+                chat_log = self._widgets["chat"]
+                if (history is not self._last_chat_history
+                        or len(history) < self._last_chat_len
+                        or len(history) - self._chat_first > 2 * _CHAT_RECENT):
+                    # New conversation or too many appended: redraw the header and the last few messages
+                    logger.debug("Updating chat history with %s messages", len(history))
+                    chat_log.clear()
+                    chat_lines = [_CHAT_HEADER, _CHAT_SPACER]
+                    start = max(len(history) - _CHAT_RECENT, 0)
+                    self._chat_first = start
+                else:
+                    # Same conversation: append only the messages not yet shown
+                    chat_lines = []
+                    start = self._last_chat_len
                 
-                for i, msg in enumerate(recent_messages):
-                    role = msg['role']
-                    content = msg['content']
-                    
+                for msg in history[start:]:
                     # Use the new wrapped formatting for each message
-                    wrapped_msg_lines = format_chat_message_wrapped(role, content, width=65)
-                    for line in wrapped_msg_lines:
-                        chat_log.write(line)
+                    chat_lines.extend(format_chat_message_wrapped(msg['role'], msg['content'], width=65))
+                if chat_lines:
+                    chat_log.write_lines(chat_lines)
                 
-                chat_log.write("└" + "─" * 63 + "┘")
-            else:
-                print("DEBUG: No chat history to display")
+                self._last_chat_history = history
+                self._last_chat_len = len(history)
+                self._chat_placeholder_shown = False
+            elif not self._chat_placeholder_shown:
+                logger.debug("No chat history to display")
                 # Show placeholder when no chat history is available
                 try:
-                    chat_log = self.query_one("#chat", Log)
+                    chat_log = self._widgets["chat"]
                     chat_log.clear()
-                    chat_log.write("No chat history yet...")
-                    chat_log.write("Start a project to see chat messages here")
-                except Exception as e:
-                    print(f"DEBUG: Error updating empty chat: {e}")
-        except Exception as e:
-            print(f"DEBUG: UI update error: {e}")
+                    chat_log.write_lines([
+                        "No chat history yet...",
+                        "Start a project to see chat messages here",
+                    ])
+                    self._last_chat_history = None
+                    self._last_chat_len = 0
+                    self._chat_placeholder_shown = True
+                except Exception:
+                    logger.exception("Error updating empty chat")
+        except Exception:
+            logger.exception("UI update error")
+
+    def update_tree_incremental(self, new_files):
+        """Update the cached tree index for new_files and return wrapped tree lines.
+        Only newly added paths are walked; removals or a change touching more
+        than 25% of the tree fall back to a full rebuild."""
+        filenames = {f['filename'] for f in new_files}
+        added = filenames - self._tree_files
+        removed = self._tree_files - filenames
+        
+        if self._tree_state is None or removed:
+            rebuild = True
+        else:
+            node_count = sum(len(children) for children in self._tree_state.values())
+            rebuild = len(added) * 4 > node_count
+        
+        if rebuild:
+            self._tree_state = build_tree_index(new_files)
+        else:
+            for filename in added:
+                add_tree_paths(self._tree_state, filename)
+        self._tree_files = frozenset(filenames)
+        
+        return wrap_lines(render_tree(self._tree_state, len(new_files)), width=70)
+
+    # Mark status fields for repaint on the next update_ui pass
+    def watch_current_operation(self):
+        self._dirty_fields.add('current_operation')
+
+    def watch_main_output(self):
+        self._dirty_fields.add('main_output')
+
+    def watch_error_output(self):
+        self._dirty_fields.add('error_output')
+
+    def watch_feedback(self):
+        self._dirty_fields.add('feedback')
+
+    def watch_detected_language(self):
+        self._dirty_fields.add('detected_language')
+
+    def watch_main_file(self):
+        self._dirty_fields.add('main_file')
+
+    def watch_compilation_status(self):
+        self._dirty_fields.add('compilation_status')
+
+    def watch_project_files(self, old_files, new_files):
+        """Refresh tree and language info only when the set of filenames changes"""
+        # Without a key the tree area holds the setup instructions; action_reload_key redraws it
+        if not self.api_key_valid:
+            return
+        if tuple(sorted(f['filename'] for f in new_files)) == self._last_tree_key:
+            return
+        self._refresh_tree()
+
+    def _refresh_tree(self):
+        """Re-detect the main file and redraw the project structure tree"""
+        files = self.project_files
+        self._last_tree_key = tuple(sorted(f['filename'] for f in files))
+        main_file = detect_main_file(files) if files else None
+        if main_file:
+            self.main_file = main_file
+            lang_name, _, _, _, _ = get_language_info(main_file)
+            self.detected_language = lang_name
+        elif files:
+            self.main_file = ""
+            self.detected_language = "Unknown"
+        
+        try:
+            tree_log = self._widgets["tree"]
+            tree_log.clear()
+            if files:
+                logger.debug("Updating project structure with %s files", len(files))
+                
+                # Use the new wrapped formatting
+                wrapped_tree_lines = self.update_tree_incremental(files)
+                logger.debug("Generated %s tree lines", len(wrapped_tree_lines))
+                tree_log.write_lines(wrapped_tree_lines)
+            else:
+                # Show placeholder when no project is loaded
+                tree_log.write_lines([
+                    "No project loaded yet...",
+                    "Create a project to see its structure here",
+                ])
+        except Exception:
+            logger.exception("Error updating project tree")
 
     def _setup_monitoring_tables(self):
         """Setup monitoring display (simplified - no tables needed)"""
         # Since we simplified the UI, no table setup is needed
         # Just ensure monitoring log is ready
         try:
-            log = self.query_one("#monitoring_log", Log)
+            log = self._widgets["monitoring_log"]
             log.clear()
-            log.write("Monitoring system ready")
-        except Exception as e:
-            print(f"Error setting up monitoring display: {e}")
+            log.write_line("Monitoring system ready")
+        except Exception:
+            logger.exception("Error setting up monitoring display")
 
     # Add missing helper methods that are called but not defined
     def _set_project_active(self, active):
@@ -1275,68 +1487,80 @@ class CodingAgentApp(App):
         self.project_active = active
         self.update_project_controls()
 
+    def _files_changed(self, files):
+        """Return True if files differ in names or sizes from the last call"""
+        files_hash = hash(tuple((f['filename'], len(f['content'])) for f in files))
+        if files_hash == self._last_files_hash:
+            return False
+        self._last_files_hash = files_hash
+        return True
+
+    def _call_from_thread_batch(self, *calls):
+        """Run several (callback, *args) UI updates with a single hop to the event loop"""
+        self.call_from_thread(self._run_ui_calls, calls)
+
+    def _run_ui_calls(self, calls):
+        """Apply a batch of UI updates queued by a worker thread"""
+        for callback, *args in calls:
+            callback(*args)
+
     def _update_operation_status(self, status):
         """Update operation status"""
         self.current_operation = status
-        self.update_ui()
+        self._mark_dirty('ui')
 
     def _update_error(self, error):
         """Update error output"""
         self.error_output = error
-        self.update_ui()
+        self._mark_dirty('ui')
 
     def _update_outputs(self, output, error):
         """Update both output and error"""
         self.main_output = output
         self.error_output = error
-        self.update_ui()
+        self._mark_dirty('ui')
 
     def _update_compilation_status(self, status):
         """Update compilation status"""
         self.compilation_status = status
-        self.update_ui()
+        self._mark_dirty('ui')
 
     def _update_feedback(self, feedback):
         """Update feedback display"""
         self.feedback = feedback
-        self.update_ui()
+        self._mark_dirty('ui')
 
     def _update_language_detection(self, files):
-        """Update detected language and main file"""
-        main_file = detect_main_file(files)
-        if main_file:
-            self.main_file = main_file
-            lang_name, _, _, _, _ = get_language_info(main_file)
-            self.detected_language = lang_name
-        else:
-            self.main_file = ""
-            self.detected_language = "Unknown"
+        """Sync project files; watch_project_files updates language, main file and tree"""
+        self.project_files = list(files)
 
     def _show_feedback_controls(self):
         """Show feedback input controls"""
         try:
-            self.query_one("#feedback_input", Input).display = True
-            self.query_one("#feedback_btn", Button).display = True
-            self.query_one("#complete_btn", Button).display = True
-        except Exception as e:
-            print(f"DEBUG: Error showing feedback controls: {e}")
+            self._widgets["feedback_input"].display = True
+            self._widgets["feedback_btn"].display = True
+            self._widgets["complete_btn"].display = True
+        except Exception:
+            logger.exception("Error showing feedback controls")
 
     def _clear_feedback_input(self):
         """Clear feedback input field"""
         try:
-            self.query_one("#feedback_input", Input).value = ""
-        except Exception as e:
-            print(f"DEBUG: Error clearing feedback input: {e}")
+            self._widgets["feedback_input"].value = ""
+        except Exception:
+            logger.exception("Error clearing feedback input")
 
     def _task_completed(self):
         """Mark task as completed"""
         self.operation_in_progress = False
-        self.update_ui()
+        self._mark_dirty('ui')
 
     def call_llm_threaded(self, model, chat_history, max_tokens):
         """Call LLM with proper monitoring integration and UI updates"""
         try:
-            print(f"Making LLM call with model: {model}")
+            from llm_utils import LLMUtils
+            
+            logger.debug("Making LLM call with model: %s", model)
             
             # Make the LLM call
             response = LLMUtils.call_llm(model, chat_history, max_tokens)
@@ -1344,57 +1568,51 @@ class CodingAgentApp(App):
             # For fallback monitoring, manually log the call
             if isinstance(self.monitor, FallbackMonitoring):
                 # Estimate token usage and cost for fallback monitoring
-                estimated_tokens = len(str(chat_history)) // 4 + len(str(response)) // 4
+                estimated_tokens = _approx_tokens(chat_history, response)
                 estimated_cost = estimated_tokens * 0.00001  # Rough estimate
                 self.monitor.log_api_call(model, estimated_tokens, estimated_cost)
             
             # Force monitoring update after LLM call
             if self.monitor:
-                print("Triggering monitoring update after LLM call")
-                try:
-                    # Update monitoring display from the thread
-                    self.call_from_thread(self.update_monitoring_display)
-                except Exception as e:
-                    print(f"Error updating monitoring from thread: {e}")
+                logger.debug("Triggering monitoring update after LLM call")
+                self._mark_dirty('monitoring')
             
             return response, None
         except Exception as e:
-            print(f"Error in LLM call: {e}")
+            logger.exception("Error in LLM call")
             return None, str(e)
 
-    def generate_change_summary(self, old_files, new_files, is_initial):
-        """Generate a summary of changes between file versions"""
+    def generate_change_summary(self, old_contents, new_files, is_initial):
+        """Generate a summary of changes between file versions.
+        old_contents is a file_contents() snapshot of the previous files."""
         if is_initial:
             return f"=== INITIAL PROJECT CREATION ===\n📁 Created {len(new_files)} new files"
         
-        if not old_files:
+        if not old_contents:
             return f"=== PROJECT UPDATE ===\n📁 Generated {len(new_files)} files"
         
         changes = []
-        old_names = {f['filename'] for f in old_files}
-        new_names = {f['filename'] for f in new_files}
-        
-        # New files
-        added = new_names - old_names
-        if added:
-            changes.append(f"➕ Added: {', '.join(sorted(added))}")
-        
-        # Removed files
-        removed = old_names - new_names
-        if removed:
-            changes.append(f"➖ Removed: {', '.join(sorted(removed))}")
+        old_map = old_contents
+        new_map = file_contents(new_files)
         
-        # Modified files
-        common_files = old_names & new_names
-        modified = []
-        for filename in common_files:
-            old_content = next(f['content'] for f in old_files if f['filename'] == filename)
-            new_content = next(f['content'] for f in new_files if f['filename'] == filename)
-            if old_content != new_content:
+        # Classify every file in one scan of each map, keeping the agent's file order
+        added, removed, modified = [], [], []
+        for filename, new_content in new_map.items():
+            old_content = old_map.get(filename)
+            if old_content is None:
+                added.append(filename)
+            elif old_content != new_content:
                 modified.append(filename)
+        for filename in old_map:
+            if filename not in new_map:
+                removed.append(filename)
         
+        if added:
+            changes.append(f"➕ Added: {', '.join(added)}")
+        if removed:
+            changes.append(f"➖ Removed: {', '.join(removed)}")
         if modified:
-            changes.append(f"📝 Modified: {', '.join(sorted(modified))}")
+            changes.append(f"📝 Modified: {', '.join(modified)}")
         
         if not changes:
             changes.append("🔄 No significant changes detected")
@@ -1403,64 +1621,48 @@ class CodingAgentApp(App):
 
     def get_language_name_from_ext(self, ext):
         """Get human-readable language name from file extension"""
-        lang_map = {
-            '.py': 'Python',
-            '.js': 'JavaScript', 
-            '.ts': 'TypeScript',
-            '.java': 'Java',
-            '.cpp': 'C++',
-            '.c': 'C',
-            '.cs': 'C#',
-            '.go': 'Go',
-            '.rs': 'Rust',
-            '.rb': 'Ruby',
-            '.php': 'PHP',
-            '.html': 'HTML',
-            '.css': 'CSS',
-            '.json': 'JSON',
-            '.md': 'Markdown',
-            '.txt': 'Text',
-            '.xml': 'XML',
-            '.yml': 'YAML',
-            '.yaml': 'YAML',
-            '.sh': 'Shell',
-            '.bat': 'Batch'
-        }
-        return lang_map.get(ext.lower(), 'Unknown')
+        return _LANGUAGE_NAMES.get(ext.lower(), 'Unknown')
 
     def extract_dependencies(self, content, ext):
         """Extract dependencies from file content based on extension"""
         dependencies = set()
         if ext == '.py':
-            for line in content.split('\n'):
-                line = line.strip()
-                if line.startswith('import ') or line.startswith('from '):
-                    if 'import ' in line and not line.startswith('from .') and not line.startswith('from ..'):
-                        parts = line.replace('from ', '').replace('import ', '').split()
-                        if parts:
-                            pkg = parts[0].split('.')[0]
-                            if pkg not in ['os', 'sys', 'json', 're', 'datetime', 'time', 'threading']:
-                                dependencies.add(f"Python: {pkg}")
+            for match in _PY_IMPORT_RE.finditer(content):
+                pkg = (match.group(1) or match.group(2)).split('.')[0]
+                if pkg not in _STDLIB:
+                    dependencies.add(f"Python: {pkg}")
         elif ext == '.js':
-            for line in content.split('\n'):
-                if 'require(' in line:
-                    match = re.search(r"require\(['\"]([^'\"]+)['\"]", line)
-                    if match:
-                        pkg = match.group(1)
-                        if not pkg.startswith('.') and not pkg.startswith('/'):
-                            dependencies.add(f"Node.js: {pkg}")
+            for match in _JS_REQUIRE_RE.finditer(content):
+                pkg = match.group(1)
+                if not pkg.startswith('.') and not pkg.startswith('/'):
+                    dependencies.add(f"Node.js: {pkg}")
         return dependencies
 
     # Action methods for monitoring and controls
     def action_reload_key(self):
         """Reload API key"""
         self.check_and_initialize_api()
+        if self.api_key_valid:
+            # Replace the setup instructions with the project tree
+            self._refresh_tree()
         self.notify("API key reloaded", severity="information")
 
-    def action_cancel_operation(self):
+    def on_unmount(self):
+        """Stop the agent worker and release the thread pool"""
+        if self.cancel_event:
+            self.cancel_event.set()
+        self._cancel_agent_task()
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def action_cancel_operation(self):
         """Cancel current operation"""
         if self.cancel_event:
             self.cancel_event.set()
+        task = self._agent_task
+        if task and not task.done():
+            task.cancel()
+            await asyncio.wait([task], timeout=1)
         self.operation_in_progress = False
         self.notify("Operation cancelled", severity="warning")
 
@@ -1468,6 +1670,7 @@ class CodingAgentApp(App):
         """Copy output to clipboard"""
         try:
             output_text = f"Output: {self.main_output}\n\nError: {self.error_output}"
+            pyperclip = _get_pyperclip()
             if pyperclip:
                 pyperclip.copy(output_text)
                 self.notify("Output copied to clipboard", severity="information")
@@ -1480,6 +1683,7 @@ class CodingAgentApp(App):
         """Copy all project data"""
         try:
             all_data = f"Project: {self.task_prompt}\n\nFiles: {len(self.project_files)}\n\nOutput: {self.main_output}\n\nError: {self.error_output}"
+            pyperclip = _get_pyperclip()
             if pyperclip:
                 pyperclip.copy(all_data)
                 self.notify("All project data copied to clipboard", severity="information")
@@ -1491,12 +1695,12 @@ class CodingAgentApp(App):
     def action_refresh_monitoring(self):
         """Refresh monitoring data (responds to F2 key)"""
         try:
-            print("Manual monitoring refresh triggered")
+            logger.debug("Manual monitoring refresh triggered")
             
             # Force a monitoring update if we have a monitor
             if self.monitor:
-                print("Monitor available, updating display...")
-                self.update_monitoring_display()
+                logger.debug("Monitor available, updating display...")
+                self._mark_dirty('monitoring')
                 
                 # Also try to get fresh data from the monitor
                 if hasattr(self.monitor, 'refresh_data'):
@@ -1504,19 +1708,60 @@ class CodingAgentApp(App):
                 
                 self.notify("Monitoring data refreshed manually", severity="information")
             else:
-                print("No monitor available, trying to reinitialize...")
+                logger.info("No monitor available, trying to reinitialize...")
                 # Try to reinitialize monitoring
                 self.initialize_monitoring()
                 if self.monitor:
-                    self.update_monitoring_display()
+                    self._mark_dirty('monitoring')
                     self.notify("Monitoring system reinitialized and refreshed", severity="information")
                 else:
                     self.notify("Monitoring system not available", severity="warning")
                     
         except Exception as e:
-            print(f"Error during manual monitoring refresh: {e}")
+            logger.exception("Error during manual monitoring refresh")
             self.notify(f"Error refreshing monitoring: {str(e)}", severity="error")
 
+    def _iter_latex(self, session_data, now):
+        """Yield the LaTeX source for the monitoring report section by section"""
+        yield _LATEX_PREAMBLE
+        yield "\\date{%s}\n\n" % now.strftime("%B %d, %Y")
+        yield _LATEX_SUMMARY_HEAD
+        rows = (
+            ("Total API Calls", f"{session_data.get('total_calls', 0)}"),
+            ("Total Tokens", f"{session_data.get('total_tokens', 0):,}"),
+            ("Total Cost", f"\\${session_data.get('total_cost', 0):.4f}"),
+            ("Session Cost", f"\\${session_data.get('session_cost', 0):.4f}"),
+        )
+        for metric, value in rows:
+            yield "%s & %s \\\\\n" % (metric, value)
+        yield _LATEX_SUMMARY_TAIL
+        model_usage = session_data.get('recent_model_usage') or session_data.get('model_usage')
+        if model_usage:
+            yield "\\section{Model Usage}\n\\begin{itemize}\n"
+            yield "\n".join(
+                f"\\item {escape_latex(model)}: {usage.get('calls', 0)} calls, "
+                f"\\${usage.get('total_cost', 0):.4f}"
+                for model, usage in model_usage.items()
+            )
+            yield "\n\\end{itemize}\n\n"
+        yield _LATEX_DETAILS_HEAD
+        yield "\\item Report generated: %s\n" % now.strftime("%Y-%m-%d %H:%M:%S")
+        yield "\\item Monitoring system: %s\n" % ("Active" if self.monitoring_enabled else "Inactive")
+        yield _LATEX_DETAILS_TAIL
+
+    @staticmethod
+    def _write_latex(path, chunks):
+        """Stream LaTeX chunks to disk as they are produced"""
+        with open(path, 'w', encoding='utf-8') as f:
+            f.writelines(chunks)
+
+    def _remember_report(self, key, filename):
+        """Record a generated report, keeping only the 4 most recent"""
+        self._report_cache[key] = filename
+        self._report_cache.move_to_end(key)
+        while len(self._report_cache) > 4:
+            self._report_cache.popitem(last=False)
+
     async def action_generate_report(self):
         """Generate simple LaTeX monitoring report"""
         try:
@@ -1527,7 +1772,9 @@ class CodingAgentApp(App):
             self._update_operation_status("Generating LaTeX report...")
             
             # Create a simple LaTeX report directly without complex integration
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            from datetime import datetime as _dt
+            now = _dt.now()
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             report_filename = f"monitoring_report_{timestamp}.tex"
             
             # Get basic monitoring data
@@ -1545,71 +1792,45 @@ class CodingAgentApp(App):
                         'total_cost': getattr(self.monitor, 'session_data', {}).get('total_cost', 0.0),
                         'session_cost': getattr(self.monitor, 'session_data', {}).get('session_cost', 0.0)
                     }
-            except Exception as e:
-                print(f"Error getting session data: {e}")
+            except Exception:
+                logger.exception("Error getting session data")
                 session_data = {'total_calls': 0, 'total_tokens': 0, 'total_cost': 0.0, 'session_cost': 0.0}
             
-            # Generate simple LaTeX content
-            latex_content = f"""\\documentclass{{article}}
-\\usepackage{{geometry}}
-\\usepackage{{booktabs}}
-\\usepackage{{amsmath}}
-\\geometry{{margin=1in}}
-
-\\title{{LLM Monitoring Report}}
-\\author{{LLM Coding Agent}}
-\\date{{{datetime.datetime.now().strftime("%B %d, %Y")}}}
-
-\\begin{{document}}
-\\maketitle
-
-\\section{{Session Summary}}
-This report contains monitoring data for the LLM Coding Agent session.
-
-\\begin{{table}}[h]
-\\centering
-\\begin{{tabular}}{{lr}}
-\\toprule
-Metric & Value \\\\
-\\midrule
-Total API Calls & {session_data.get('total_calls', 0)} \\\\
-Total Tokens & {session_data.get('total_tokens', 0):,} \\\\
-Total Cost & \\${session_data.get('total_cost', 0):.4f} \\\\
-Session Cost & \\${session_data.get('session_cost', 0):.4f} \\\\
-\\bottomrule
-\\end{{tabular}}
-\\caption{{API Usage Statistics}}
-\\end{{table}}
-
-\\section{{Report Details}}
-\\begin{{itemize}}
-\\item Report generated: {datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-\\item Monitoring system: {"Active" if self.monitoring_enabled else "Inactive"}
-\\item Agent version: LLM Coding Agent v1.0
-\\end{{itemize}}
-
-\\end{{document}}"""
+            # The monitor may hand out a live view; freeze it so the key and the report agree
+            session_data = dict(session_data)
             
-            # Write the LaTeX file
+            # Reuse the last report for identical session data if it is still on disk
+            report_key = content_digest(repr((sorted(session_data.items()), self.monitoring_enabled)))
+            cached_report = self._report_cache.get(report_key)
+            if cached_report and os.path.exists(cached_report):
+                self._report_cache.move_to_end(report_key)
+                self._update_operation_status("Report unchanged")
+                self.notify(f"Report unchanged, reusing existing file: {cached_report}", severity="information")
+                return
+            
+            # Write the LaTeX file, building it chunk by chunk off the event loop
             try:
-                with open(report_filename, 'w', encoding='utf-8') as f:
-                    f.write(latex_content)
+                # Use the default pool so a long agent run never delays the report
+                await asyncio.to_thread(self._write_latex, report_filename, self._iter_latex(session_data, now))
                 
                 self._update_operation_status("LaTeX report generated successfully")
                 
                 # Try to compile to PDF if LaTeX is available
                 try:
-                    result = subprocess.run(['pdflatex', '--version'], 
-                                          capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
+                    # Memoized PATH lookup instead of spawning pdflatex --version each time
+                    if check_compiler_available('pdflatex'):
                         self._update_operation_status("Compiling LaTeX to PDF...")
-                        pdf_result = subprocess.run(['pdflatex', report_filename], 
-                                                  capture_output=True, text=True, timeout=30)
-                        if pdf_result.returncode == 0:
+                        returncode = await compile_latex_report(report_filename, cancel_event=self.cancel_event)
+                        if returncode == 0:
+                            self._remember_report(report_key, report_filename.replace('.tex', '.pdf'))
                             self.notify(f"PDF report generated: {report_filename.replace('.tex', '.pdf')}", severity="information")
+                        elif self.cancel_event.is_set():
+                            self._update_operation_status("PDF compilation cancelled")
+                            self.notify(f"LaTeX report generated: {report_filename} (PDF compilation cancelled)", severity="warning")
                         else:
                             self.notify(f"LaTeX report generated: {report_filename} (PDF compilation failed)", severity="warning")
                     else:
+                        self._remember_report(report_key, report_filename)
                         self.notify(f"LaTeX report generated: {report_filename} (Install LaTeX for PDF)", severity="information")
                 except (FileNotFoundError, subprocess.TimeoutExpired):
                     self.notify(f"LaTeX report generated: {report_filename} (Install LaTeX for PDF)", severity="information")
@@ -1620,14 +1841,14 @@ Session Cost & \\${session_data.get('session_cost', 0):.4f} \\\\
         except Exception as e:
             self._update_operation_status("Report generation error")
             self.notify(f"Error generating report: {str(e)}", severity="error")
-            print(f"Report generation error: {e}")
+            logger.exception("Report generation error")
 
     async def action_reset_stats(self):
         """Reset monitoring statistics"""
         try:
             if self.monitor:
                 self.monitor.reset_session_stats()
-                self.update_monitoring_display()
+                self._mark_dirty('monitoring')
                 self.notify("Session statistics reset", severity="information")
             else:
                 self.notify("Monitoring not available", severity="warning")
@@ -1641,16 +1862,14 @@ Session Cost & \\${session_data.get('session_cost', 0):.4f} \\\\
                 self.notify("Operation already in progress. Please wait.", severity="warning")
                 return
             
-            # Check if prompter.txt exists
-            prompter_file = os.path.join(os.path.dirname(__file__), 'prompter.txt')
-            if not os.path.exists(prompter_file):
+            # Read the contents of prompter.txt
+            try:
+                with open(_PROMPTER_PATH, 'r', encoding='utf-8') as f:
+                    prompter_content = f.read().strip()
+            except FileNotFoundError:
                 self.notify("prompter.txt file not found", severity="error")
                 return
             
-            # Read the contents of prompter.txt
-            with open(prompter_file, 'r', encoding='utf-8') as f:
-                prompter_content = f.read().strip()
-            
             if not prompter_content:
                 self.notify("prompter.txt is empty", severity="warning")
                 return
@@ -1676,7 +1895,9 @@ Session Cost & \\${session_data.get('session_cost', 0):.4f} \\\\
     def action_analyze_project(self):
         """Analyze current project files - our simple new feature!"""
         try:
-            if not SIMPLE_ANALYZER_AVAILABLE:
+            try:
+                from simple_analyzer import analyze_project_files, format_analysis_for_display
+            except ImportError:
                 self.notify("Simple analyzer not available", severity="warning")
                 return
             
@@ -1689,17 +1910,50 @@ Session Cost & \\${session_data.get('session_cost', 0):.4f} \\\\
             formatted_lines = format_analysis_for_display(analysis)
             
             # Show results in the tree area
-            tree_log = self.query_one("#tree", Log)
+            tree_log = self._widgets["tree"]
             tree_log.clear()
-            tree_log.write("=== PROJECT ANALYSIS ===")
-            for line in formatted_lines:
-                tree_log.write(line)
+            tree_log.write_lines(["=== PROJECT ANALYSIS ===", *formatted_lines])
+            self._last_tree_key = None
             
             self.notify("Project analysis complete!", severity="information")
             
         except Exception as e:
             self.notify(f"Error analyzing project: {str(e)}", severity="error")
-            print(f"Analysis error: {e}")
+            logger.exception("Analysis error")
+
+    def _exec_key(self, files):
+        """Digest of the project folder and every file's name and content, independent of file order"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(str(self.agent.project_folder).encode('utf-8'))
+        for f in sorted(files, key=lambda f: f['filename']):
+            h.update(b'\0' + f['filename'].encode('utf-8') + b'\0' + f['content'].encode('utf-8'))
+        return h.digest()
+
+    def _remember_execution(self, exec_key, result):
+        """Record an execution result, keeping only the 8 most recent"""
+        self._exec_cache[exec_key] = result
+        self._exec_cache.move_to_end(exec_key)
+        while len(self._exec_cache) > 8:
+            self._exec_cache.popitem(last=False)
+
+    def _write_and_execute_cached(self, files):
+        """Write and run files, reusing the result of an identical recent run in the same project folder"""
+        exec_key = self._exec_key(files)
+        cached = self._exec_cache.get(exec_key)
+        if cached is not None:
+            self._exec_cache.move_to_end(exec_key)
+            logger.debug("Files identical to a recent run, reusing execution result")
+            # Keep the agent's state in step with what write_and_execute_files would record
+            self.agent.project_files = files
+            self.agent.chat_history.append({
+                "role": "system",
+                "content": f"Project files updated. Files: {len(files)}"
+            })
+            return cached
+        
+        result = self.agent.write_and_execute_files(files)
+        self._remember_execution(exec_key, result)
+        return result
 
     def process_task_threaded(self, task):
         """Threaded task processing that updates UI via call_from_thread"""
@@ -1711,35 +1965,31 @@ Session Cost & \\${session_data.get('session_cost', 0):.4f} \\\\
         # Clear cancel event
         self.cancel_event.clear()
         
-        # Mark project as active
-        self.call_from_thread(self._set_project_active, True)
-        
         # Initialize task WITHOUT calling LLM yet
         self.agent.task_prompt = task
         self.agent.project_folder = safe_project_name(task)
         
         # Initialize chat history manually instead of calling get_task()
-        system_prompt = """You are an expert software engineer. When asked for a project, return a JSON object with a 'files' key. Each file should be an object with 'filename' and 'content'. Example:
-{'files': [{'filename': 'main.py', 'content': '...'}, {'filename': 'utils.js', 'content': '...'}, {'filename': 'App.jsx', 'content': '...'}]}
-Do not include markdown or explanations. Only return the JSON."""
-        
         self.agent.chat_history = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": _SYSTEM_PROMPT},
             {"role": "user", "content": task}
         ]
         
-        # Store initial state for comparison
-        initial_files = []
+        # Snapshot of the first attempt's files for comparison
+        initial_contents = {}
         
-        # Update UI from thread
-        self.call_from_thread(self._update_operation_status, "Calling LLM API...")
+        # Mark project as active and update UI from thread
+        self._call_from_thread_batch(
+            (self._set_project_active, True),
+            (self._update_operation_status, STATUS_CALLING_LLM),
+        )
 
         # Main processing loop
         while self.agent.attempts < self.agent.max_attempts and not self.cancel_event.is_set():
             self.agent.attempts += 1
             self.call_from_thread(
                 self._update_operation_status, 
-                f"Attempt {self.agent.attempts}: Calling LLM..."
+                STATUS_ATTEMPT_CALLING % self.agent.attempts
             )
 
             try:
@@ -1751,91 +2001,109 @@ Do not include markdown or explanations. Only return the JSON."""
                 )
 
                 if self.cancel_event.is_set():
-                    self.call_from_thread(self._update_operation_status, "Operation cancelled by user")
+                    self.call_from_thread(self._update_operation_status, STATUS_CANCELLED)
                     break
 
                 if llm_error:
-                    self.call_from_thread(self._update_error, f"LLM API error: {llm_error}")
-                    self.call_from_thread(self._update_operation_status, "LLM API error occurred")
+                    self._call_from_thread_batch(
+                        (self._update_error, f"LLM API error: {llm_error}"),
+                        (self._update_operation_status, STATUS_LLM_ERROR),
+                    )
                     break
 
                 if llm_response is None:
-                    self.call_from_thread(self._update_error, "LLM returned no response")
-                    self.call_from_thread(self._update_operation_status, "LLM returned no response")
+                    self._call_from_thread_batch(
+                        (self._update_error, "LLM returned no response"),
+                        (self._update_operation_status, STATUS_NO_RESPONSE),
+                    )
                     break
 
             except Exception as e:
-                self.call_from_thread(self._update_error, f"LLM API error: {str(e)}")
-                self.call_from_thread(self._update_operation_status, "LLM API error occurred")
+                self._call_from_thread_batch(
+                    (self._update_error, f"LLM API error: {str(e)}"),
+                    (self._update_operation_status, STATUS_LLM_ERROR),
+                )
                 break
 
             # Parse files with retry logic
-            self.call_from_thread(self._update_operation_status, "Parsing files...")
+            self.call_from_thread(self._update_operation_status, STATUS_PARSING)
             
             try:
                 files = self.agent.parse_files(llm_response, max_prompt_attempts=self.max_json_retries)
                 if self.cancel_event.is_set():
                     break
             except Exception as e:
-                self.call_from_thread(self._update_error, f"JSON parse error: {str(e)}")
-                self.call_from_thread(self._update_operation_status, "JSON parsing failed")
+                self._call_from_thread_batch(
+                    (self._update_error, f"JSON parse error: {str(e)}"),
+                    (self._update_operation_status, STATUS_PARSE_FAILED),
+                )
                 break
 
             if not files:
-                self.call_from_thread(self._update_error, "No files generated")
-                self.call_from_thread(self._update_operation_status, "No files generated")
+                self._call_from_thread_batch(
+                    (self._update_error, "No files generated"),
+                    (self._update_operation_status, STATUS_NO_FILES),
+                )
                 continue
 
-            # Store files for comparison
+            # Store file contents for comparison
             if self.agent.attempts == 1:
-                initial_files = files.copy()
+                initial_contents = file_contents(files)
             
             self.agent.project_files = files
             
-            # Update language detection
-            self.call_from_thread(self._update_language_detection, files)
-            self.call_from_thread(self.update_ui)
-
-            # Write and execute files
-            self.call_from_thread(self._update_operation_status, "Writing files and compiling/executing...")
+            # Update language detection if the files changed and announce the write/execute step
+            ui_calls = [(self._update_operation_status, STATUS_WRITING)]
+            if self._files_changed(files):
+                ui_calls[:0] = [(self._update_language_detection, files), (self._mark_dirty, 'ui')]
+            self._call_from_thread_batch(*ui_calls)
             
             try:
                 output, error, success = self.agent.write_and_execute_files(files)
-                self.call_from_thread(self._update_outputs, output, error)
-                self.call_from_thread(self._update_compilation_status, "Success" if success else "Failed")
+                # A new task always runs; its result lets an unchanged feedback round skip the rerun
+                self._remember_execution(self._exec_key(files), (output, error, success))
+                self._call_from_thread_batch(
+                    (self._update_outputs, output, error),
+                    (self._update_compilation_status, "Success" if success else "Failed"),
+                )
 
             except Exception as e:
-                self.call_from_thread(self._update_error, f"Execution error: {str(e)}")
-                self.call_from_thread(self._update_compilation_status, "Error")
+                self._call_from_thread_batch(
+                    (self._update_error, f"Execution error: {str(e)}"),
+                    (self._update_compilation_status, "Error"),
+                )
                 break
 
             # Evaluate output and generate feedback with change summary
             if not self.cancel_event.is_set():
-                change_summary = self.generate_change_summary(initial_files, files, self.agent.attempts == 1)
+                change_summary = self.generate_change_summary(initial_contents, files, self.agent.attempts == 1)
                 
                 # Generate human advice
                 advice = self.generate_human_advice(files, output, error, success)
                 
                 # Show feedback controls and set completion status
-                self.call_from_thread(self._show_feedback_controls)
-                self.call_from_thread(self._update_operation_status, f"Project attempt {self.agent.attempts} completed - awaiting feedback")
+                self._call_from_thread_batch(
+                    (self._show_feedback_controls,),
+                    (self._update_operation_status, STATUS_ATTEMPT_DONE % self.agent.attempts),
+                )
                 break
 
         # Final status update
         if not self.cancel_event.is_set():
-            self.call_from_thread(self._update_operation_status, "Project processing completed")
-        
-        self.call_from_thread(self._task_completed)
+            self._call_from_thread_batch(
+                (self._update_operation_status, STATUS_COMPLETED),
+                (self._task_completed,),
+            )
+        else:
+            self.call_from_thread(self._task_completed)
 
     def process_feedback_threaded(self, feedback):
         """Threaded feedback processing"""
         # Clear cancel event
         self.cancel_event.clear()
         
-        # Store current state for comparison
-        old_files = self.agent.project_files.copy() if self.agent.project_files else []
-        
-        self.call_from_thread(self._update_operation_status, "Processing feedback...")
+        # Snapshot the current files for comparison
+        old_contents = file_contents(self.agent.project_files or [])
         
         # Check if this is a specific file fix request
         if "fix" in feedback.lower() or "update" in feedback.lower():
@@ -1843,40 +2111,62 @@ Do not include markdown or explanations. Only return the JSON."""
         else:
             feedback_with_context = feedback
         
-        self.call_from_thread(self._update_feedback, feedback)
+        self._call_from_thread_batch(
+            (self._update_operation_status, STATUS_FEEDBACK),
+            (self._update_feedback, feedback),
+        )
 
         # Process the feedback
         try:
             result_files = self.agent.process_feedback(feedback_with_context)
             
+            # Stop before touching the project if the user cancelled during the LLM call
+            if self.cancel_event.is_set():
+                self.call_from_thread(self._update_operation_status, STATUS_CANCELLED)
+                return
+            
             if result_files:
                 # Update language detection
-                self.call_from_thread(self._update_language_detection, result_files)
-                self.call_from_thread(self.update_ui)
+                if self._files_changed(result_files):
+                    self._call_from_thread_batch(
+                        (self._update_language_detection, result_files),
+                        (self._mark_dirty, 'ui'),
+                    )
                 
                 # Write and execute updated files
                 try:
-                    output, error, success = self.agent.write_and_execute_files(result_files)
-                    self.call_from_thread(self._update_outputs, output, error)
-                    self.call_from_thread(self._update_compilation_status, "Success" if success else "Failed")
+                    output, error, success = self._write_and_execute_cached(result_files)
+                    if self.cancel_event.is_set():
+                        self.call_from_thread(self._update_operation_status, STATUS_CANCELLED)
+                        return
                     
                     # Generate change summary
-                    change_summary = self.generate_change_summary(old_files, result_files, False)
+                    change_summary = self.generate_change_summary(old_contents, result_files, False)
                     
-                    # Clear feedback input and update status
-                    self.call_from_thread(self._clear_feedback_input)
-                    self.call_from_thread(self._update_operation_status, "Feedback processed successfully")
+                    # Show results, clear feedback input and update status in one hop
+                    self._call_from_thread_batch(
+                        (self._update_outputs, output, error),
+                        (self._update_compilation_status, "Success" if success else "Failed"),
+                        (self._clear_feedback_input,),
+                        (self._update_operation_status, STATUS_FEEDBACK_DONE),
+                    )
                     
                 except Exception as e:
-                    self.call_from_thread(self._update_error, f"Execution error: {str(e)}")
-                    self.call_from_thread(self._update_compilation_status, "Error")
+                    self._call_from_thread_batch(
+                        (self._update_error, f"Execution error: {str(e)}"),
+                        (self._update_compilation_status, "Error"),
+                    )
             else:
-                self.call_from_thread(self._update_error, "No files generated from feedback")
-                self.call_from_thread(self._update_operation_status, "Feedback processing failed")
+                self._call_from_thread_batch(
+                    (self._update_error, "No files generated from feedback"),
+                    (self._update_operation_status, STATUS_FEEDBACK_FAILED),
+                )
 
         except Exception as e:
-            self.call_from_thread(self._update_error, f"Feedback processing error: {str(e)}")
-            self.call_from_thread(self._update_operation_status, "Feedback processing failed")
+            self._call_from_thread_batch(
+                (self._update_error, f"Feedback processing error: {str(e)}"),
+                (self._update_operation_status, STATUS_FEEDBACK_FAILED),
+            )
 
     def generate_human_advice(self, files, output, error, success):
         """Generate human-readable advice based on project results"""
@@ -1885,11 +2175,11 @@ Do not include markdown or explanations. Only return the JSON."""
         if success:
             advice_lines.append("✅ Project executed successfully!")
             if output:
-                advice_lines.append(f"📄 Output: {output[:100]}{'...' if len(output) > 100 else ''}")
+                advice_lines.append(f"📄 Output: {truncate_text(output)}")
         else:
             advice_lines.append("❌ Project execution failed")
             if error:
-                advice_lines.append(f"🚨 Error: {error[:100]}{'...' if len(error) > 100 else ''}")
+                advice_lines.append(f"🚨 Error: {truncate_text(error)}")
                 
                 # Provide specific advice based on error type
                 if "ModuleNotFoundError" in error or "ImportError" in error:
@@ -1919,9 +2209,19 @@ class FallbackMonitoring:
             'total_calls': 0,
             'total_tokens': 0, 
             'total_cost': 0.0,
-            'session_cost': 0.0
+            'session_cost': 0.0,
+            'model_usage': {}
         }
         self.callback = None
+        
+        # Read-only views handed to the UI; they track session_data in place
+        self._session_view = MappingProxyType(self.session_data)
+        self._ui_data = {
+            'session': self._session_view,
+            'recent_calls': (),
+            'model_usage': MappingProxyType({})
+        }
+        self._ui_summary = MappingProxyType(self._ui_data)
     
     def log_api_call(self, model, tokens, cost):
         """Log an API call"""
@@ -1930,31 +2230,42 @@ class FallbackMonitoring:
         self.session_data['total_cost'] += cost
         self.session_data['session_cost'] += cost
         
+        # Copy on write so a shallow snapshot of session_data never sees later calls
+        model_usage = dict(self.session_data['model_usage'])
+        usage = model_usage.get(model, {'calls': 0, 'total_tokens': 0, 'total_cost': 0.0})
+        model_usage[model] = {
+            'calls': usage['calls'] + 1,
+            'total_tokens': usage['total_tokens'] + tokens,
+            'total_cost': usage['total_cost'] + cost,
+        }
+        self.session_data['model_usage'] = model_usage
+        self._ui_data['model_usage'] = MappingProxyType(model_usage)
+        
         if self.callback:
             try:
                 self.callback(self.get_ui_summary())
-            except Exception as e:
-                print(f"Error in monitoring callback: {e}")
+            except Exception:
+                logger.exception("Error in monitoring callback")
     
     def get_ui_summary(self):
         """Get UI summary for display"""
-        return {
-            'session': self.session_data.copy(),
-            'recent_calls': [],
-            'model_usage': {}
-        }
+        return self._ui_summary
+    
     def get_session_summary(self):
         """Get session summary"""
-        return self.session_data.copy()
+        return self._session_view
     
     def reset_session_stats(self):
         """Reset session statistics"""
-        self.session_data = {
+        # Reset in place so the views handed out stay valid
+        self.session_data.update({
             'total_calls': 0,
             'total_tokens': 0,
             'total_cost': 0.0,
-            'session_cost': 0.0
-        }
+            'session_cost': 0.0,
+            'model_usage': {}
+        })
+        self._ui_data['model_usage'] = MappingProxyType({})
     
     def set_callback(self, callback):
         """Set callback for monitoring updates"""
@@ -1971,12 +2282,36 @@ class MonitoringIntegration:
             # Try to use the simple fallback monitoring
             app.monitor = FallbackMonitoring()
             return True
-        except Exception as e:
-            print(f"Failed to setup monitoring: {e}")
+        except Exception:
+            logger.exception("Failed to setup monitoring")
             return False
 
+def wrap_lines(lines, width=70):
+    """Wrap each display line to the given width."""
+    wrapped_lines = []
+    for line in lines:
+        wrapped_lines.extend(textwrap.wrap(line, width=width))
+    return wrapped_lines
+
+def format_chat_message_wrapped(role, content, width=65):
+    """Format chat messages for display with wrapping."""
+    header = f"[{role.upper()}]:"
+    wrapped_content = textwrap.wrap(content, width=width)
+    return [header] + wrapped_content
+
 def main():
     """Main entry point for the Textual Agent UI"""
+    from textual.logging import TextualHandler
+    
+    # Route logs through Textual so they don't draw over the TUI
+    level = os.getenv('VCCLI_LOG_LEVEL', 'WARNING').upper()
+    # getLevelName maps known names to their int level (works before 3.11's getLevelNamesMapping)
+    if not isinstance(logging.getLevelName(level), int):
+        level = 'WARNING'
+    logging.basicConfig(
+        level=level,
+        handlers=[TextualHandler()],
+    )
     try:
         app = CodingAgentApp()
         app.run()
@@ -1988,20 +2323,3 @@ def main():
 
 if __name__ == "__main__":
     exit(main())
-
-def format_project_structure_wrapped(files, width=70):
-    """Format project structure for display with wrapping."""
-    if not files:
-        return ["No project files yet..."]
-
-    tree_lines = ascii_tree(files)
-    wrapped_lines = []
-    for line in tree_lines:
-        wrapped_lines.extend(textwrap.wrap(line, width=width))
-    return wrapped_lines
-
-def format_chat_message_wrapped(role, content, width=65):
-    """Format chat messages for display with wrapping."""
-    header = f"[{role.upper()}]:"
-    wrapped_content = textwrap.wrap(content, width=width)
-    return [header] + wrapped_content
\ No newline at end of file
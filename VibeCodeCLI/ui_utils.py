@@ -1,11 +1,19 @@
 """
 UI utilities for the textual-based coding agent
 """
+import io
 import time
 import datetime
 from rich.text import Text
 from rich.console import Console
 
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
+_PYPERCLIP_MISSING = "pyperclip not installed! Install with: pip install pyperclip"
+
 
 class UIStateManager:
     """Manages UI state and updates"""
@@ -60,46 +68,44 @@ class ClipboardManager:
     @staticmethod
     def copy_project_data(agent, main_output="", error_output="", feedback=""):
         """Copy all project data to clipboard"""
+        if pyperclip is None:
+            return False, _PYPERCLIP_MISSING
         try:
-            import pyperclip
-            
-            data_sections = []
-            data_sections.append("=== AI CODING AGENT PROJECT DATA ===")
-            data_sections.append(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}")
-            data_sections.append("")
+            # Write sections straight into one buffer; each line after the first is "\n"-prefixed
+            buf = io.StringIO()
+            write = buf.write
+            write("=== AI CODING AGENT PROJECT DATA ===")
+            write(f"\nGenerated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
             
             if agent and getattr(agent, 'project_files', None):
-                data_sections.append("=== PROJECT FILES ===")
+                write("\n=== PROJECT FILES ===")
                 for file_data in agent.project_files:
-                    data_sections.append(f"--- {file_data['filename']} ---")
-                    data_sections.append(file_data['content'])
-                    data_sections.append("")
+                    write(f"\n--- {file_data['filename']} ---\n")
+                    write(file_data['content'])
+                    write("\n")
             
             if main_output:
-                data_sections.append("=== EXECUTION OUTPUT ===")
-                data_sections.append(main_output)
-                data_sections.append("")
+                write("\n=== EXECUTION OUTPUT ===\n")
+                write(main_output)
+                write("\n")
             
             if error_output:
-                data_sections.append("=== EXECUTION ERRORS ===")
-                data_sections.append(error_output)
-                data_sections.append("")
+                write("\n=== EXECUTION ERRORS ===\n")
+                write(error_output)
+                write("\n")
             
-            full_data = "\n".join(data_sections)
-            pyperclip.copy(full_data)
+            pyperclip.copy(buf.getvalue())
             return True, "Complete project data copied to clipboard!"
             
-        except ImportError:
-            return False, "pyperclip not installed! Install with: pip install pyperclip"
         except Exception as e:
             return False, f"Failed to copy data: {str(e)}"
     
     @staticmethod
     def copy_output_only(main_output="", error_output=""):
         """Copy just the execution output to clipboard"""
+        if pyperclip is None:
+            return False, _PYPERCLIP_MISSING
         try:
-            import pyperclip
-            
             output_data = []
             if main_output:
                 output_data.append("=== EXECUTION OUTPUT ===")
@@ -115,19 +121,11 @@ class ClipboardManager:
             pyperclip.copy(full_output)
             return True, "Output copied to clipboard!"
             
-        except ImportError:
-            return False, "pyperclip not installed! Install with: pip install pyperclip"
         except Exception as e:
             return False, f"Failed to copy output: {str(e)}"
 
 
-class HelpManager:
-    """Manages help and documentation"""
-    
-    @staticmethod
-    def get_help_text():
-        """Get comprehensive help text"""
-        return """
+_HELP_TEXT = """
 === AI CODING AGENT HELP ===
 
 KEYBOARD SHORTCUTS:
@@ -165,11 +163,8 @@ Create a .env file with one of:
 • API_KEY=your_key_here
 • LLM_API_KEY=your_key_here
         """
-    
-    @staticmethod
-    def get_env_instructions():
-        """Get environment setup instructions"""
-        return """
+
+_ENV_INSTRUCTIONS = """
 🔑 API KEY REQUIRED
 
 To use this coding agent, create a .env file with your API key.
@@ -192,13 +187,21 @@ Note: Never commit your .env file to version control!
         """
 
 
-class ThemeManager:
-    """Manages UI themes and styling"""
+class HelpManager:
+    """Manages help and documentation"""
     
     @staticmethod
-    def get_github_dark_css():
-        """Get GitHub dark theme CSS"""
-        return """
+    def get_help_text():
+        """Get comprehensive help text"""
+        return _HELP_TEXT
+    
+    @staticmethod
+    def get_env_instructions():
+        """Get environment setup instructions"""
+        return _ENV_INSTRUCTIONS
+
+
+_GITHUB_DARK_CSS = """
         .panel {
             border: solid #00ff00;
             height: 100%;
@@ -294,3 +297,12 @@ class ThemeManager:
             text-style: bold;
         }
         """
+
+
+class ThemeManager:
+    """Manages UI themes and styling"""
+    
+    @staticmethod
+    def get_github_dark_css():
+        """Get GitHub dark theme CSS"""
+        return _GITHUB_DARK_CSS